@@ -268,6 +268,24 @@ REANA_SHARED_PVC_NAME = os.getenv(
 )
 """Name of the shared CEPHFS PVC which will be used by all REANA jobs."""
 
+REANA_DISK_USAGE_USE_DU = os.getenv("REANA_DISK_USAGE_USE_DU", "True").lower() == "true"
+"""Whether to compute the disk usage of workspaces with the ``du`` command.
+
+By default (enabled), ``du`` is used, as it is faster for workspaces containing
+a large number of files. When disabled, the disk usage is computed in-process,
+which avoids spawning a process for every request.
+"""
+
+REANA_FILE_ACCESS_TIME_STAT_WORKERS = int(
+    os.getenv("REANA_FILE_ACCESS_TIME_STAT_WORKERS", "0")
+)
+"""Number of threads used to read the access times of the files in workspaces.
+
+By default (``0``), files are checked one after the other. On network
+filesystems such as CephFS, where every ``stat`` call waits for the server,
+checking several files at once can make collecting access times much faster.
+"""
+
 REANA_JOB_HOSTPATH_MOUNTS = json.loads(os.getenv("REANA_JOB_HOSTPATH_MOUNTS", "[]"))
 """List of dictionaries composed of name, hostPath and mountPath.
 
@@ -7,10 +7,11 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 """REANA-Commons module to manage AMQP connections on REANA."""
 
-import json
 import logging
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 from kombu import Connection, Exchange, Queue
 
 from .config import (
@@ -21,6 +22,18 @@ from .config import (
     MQ_PRODUCER_MAX_RETRIES,
 )
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _get_exchange(name):
+    """Return a shared, unbound direct class:`kombu.Exchange` called ``name``.
+
+    Publishers only use the exchange as a declaration template, so a single
+    instance per name can be safely reused across publishers.
+    """
+    return Exchange(name=name, type="direct")
+
 
 class BasePublisher(object):
     """Base publisher to MQ."""
@@ -52,7 +65,7 @@ class BasePublisher(object):
         self._exchange = (
             exchange
             if isinstance(exchange, Exchange)
-            else Exchange(name=exchange or MQ_DEFAULT_EXCHANGE, type="direct")
+            else _get_exchange(exchange or MQ_DEFAULT_EXCHANGE)
         )
         self._queue = (
             queue
@@ -67,6 +80,12 @@ class BasePublisher(object):
         )
         self._connection = connection or Connection(MQ_CONNECTION_STRING)
         self.producer = self._build_producer()
+        self._ensured_publish = self._connection.ensure(
+            self.producer,
+            self.producer.publish,
+            errback=self.__error_callback,
+            max_retries=MQ_PRODUCER_MAX_RETRIES,
+        )
 
     def _build_producer(self):
         """Instantiate a class:`kombu.Producer`."""
@@ -81,7 +100,7 @@ class BasePublisher(object):
         :param interval: Interval in which the message delivery will be
             retried.
         """
-        logging.warning(
+        log.warning(
             f"Error while publishing: {exception}. Retrying in {interval} seconds."
         )
 
@@ -93,25 +112,19 @@ class BasePublisher(object):
             configured format (by default JSON).
         :param priority: Message priority.
         """
-        connection = self._connection.clone()
-        publish = connection.ensure(
-            self.producer,
-            self.producer.publish,
-            errback=self.__error_callback,
-            max_retries=MQ_PRODUCER_MAX_RETRIES,
-        )
-        publish(
-            json.dumps(msg),
+        self._ensured_publish(
+            orjson.dumps(msg, option=orjson.OPT_NON_STR_KEYS).decode(),
             exchange=self._exchange,
             routing_key=self._routing_key,
             declare=[self._queue],
             priority=priority,
         )
-        logging.debug("Publisher: message sent: %s", msg)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Publisher: message sent: %s", msg)
 
     def close(self):
         """Close connection."""
-        logging.debug("Publisher: closing queue connection")
+        log.debug("Publisher: closing queue connection")
         self._connection.release()
 
 
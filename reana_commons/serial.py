@@ -7,12 +7,14 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 """REANA Workflow Engine Serial implementation utils."""
 
-import json
+import os
 from copy import deepcopy
+from functools import lru_cache
 from string import Template
 
-import click
-from jsonschema import ValidationError, validate
+import orjson
+from jsonschema import Draft6Validator, ValidationError
+from jsonschema.exceptions import best_match
 
 from reana_commons.config import (
     HTCONDOR_JOB_FLAVOURS,
@@ -134,6 +136,42 @@ serial_workflow_schema = {
     },
 }
 
+Draft6Validator.check_schema(serial_workflow_schema)
+serial_workflow_validator = Draft6Validator(serial_workflow_schema)
+"""Validator for ``serial_workflow_schema``, built once at import time."""
+
+_htcondor_job_flavours_by_runtime = "' '".join(
+    sorted(HTCONDOR_JOB_FLAVOURS, key=HTCONDOR_JOB_FLAVOURS.get)
+)
+"""HTCondor job flavour names sorted by runtime, as listed in error messages."""
+
+
+@lru_cache(maxsize=1024)
+def _get_command_template(command):
+    """Return a cached ``string.Template`` for the given step command."""
+    return Template(command)
+
+
+@lru_cache(maxsize=128)
+def _load_workflow_file(workflow_file, mtime_ns, size):
+    """Parse a Serial workflow file, cached by its path, mtime and size."""
+    with open(workflow_file, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _read_workflow_file(workflow_file):
+    """Load a Serial workflow specification file.
+
+    The parsed content is reused for as long as the file is not modified, so
+    the returned dictionary must be treated as read-only.
+
+    :param workflow_file: Path to the JSON workflow specification file.
+    :returns: A dictionary which represents the workflow specification.
+    """
+    workflow_file = os.path.abspath(workflow_file)
+    file_stat = os.stat(workflow_file)
+    return _load_workflow_file(workflow_file, file_stat.st_mtime_ns, file_stat.st_size)
+
 
 def serial_load(workflow_file, specification, parameters=None, original=None, **kwargs):
     """Validate and return a expanded REANA Serial workflow specification.
@@ -143,20 +181,22 @@ def serial_load(workflow_file, specification, parameters=None, original=None, **
     :returns: A dictionary which represents the valid Serial workflow with all
         parameters expanded.
     """
+    if not specification:
+        specification = _read_workflow_file(workflow_file)
+        if original:
+            # the cached specification must not be handed out to callers
+            specification = deepcopy(specification)
+
     if not check_htcondor_max_runtime(specification):
         raise Exception("Invalid input in htcondor_max_runtime.")
 
     parameters = parameters or {}
 
-    if not specification:
-        with open(workflow_file, "r") as f:
-            specification = json.loads(f.read())
-
-    expanded_specification = _expand_parameters(specification, parameters, original)
+    error = best_match(serial_workflow_validator.iter_errors(specification))
+    if error is not None:
+        raise error
 
-    validate(specification, serial_workflow_schema)
-
-    return expanded_specification
+    return _expand_parameters(specification, parameters, original)
 
 
 def _expand_parameters(specification, parameters, original=None):
@@ -178,14 +218,22 @@ def _expand_parameters(specification, parameters, original=None):
         return specification
     else:
         try:
-            expanded_specification = deepcopy(specification)
-            for step_num, step in enumerate(expanded_specification["steps"]):
-                current_step = expanded_specification["steps"][step_num]
-                for command_num, command in enumerate(step["commands"]):
-                    current_step["commands"][command_num] = Template(
-                        command
-                    ).substitute(parameters)
-            return expanded_specification
+            # only the commands change, so copy the steps shallowly and
+            # rebuild their command lists instead of deep copying everything
+            expanded_steps = []
+            for step in specification["steps"]:
+                expanded_step = dict(step)
+                expanded_step["commands"] = [
+                    # commands without any `$` are left unchanged by Template
+                    (
+                        _get_command_template(command).substitute(parameters)
+                        if "$" in command
+                        else command
+                    )
+                    for command in step["commands"]
+                ]
+                expanded_steps.append(expanded_step)
+            return {**specification, "steps": expanded_steps}
         except KeyError as e:
             raise ValidationError(
                 "Workflow parameter(s) could not "
@@ -208,22 +256,18 @@ def check_htcondor_max_runtime(specification):
     for i, step in enumerate(steps_with_max_runtime):
         htcondor_max_runtime = step["htcondor_max_runtime"]
         if (
-            not str.isdigit(htcondor_max_runtime)
+            not htcondor_max_runtime.isdigit()
             and htcondor_max_runtime not in HTCONDOR_JOB_FLAVOURS
         ):
             check_pass = False
+            # only needed to report errors, avoid importing it otherwise
+            import click
+
             click.secho(
                 "In step {0}:\n'{1}' is not a valid input for htcondor_max_runtime. Inputs must be a digit in the form of a string, or one of the following job flavours: '{2}'.".format(
                     step.get("name", i),
                     htcondor_max_runtime,
-                    "' '".join(
-                        [
-                            k
-                            for k, v in sorted(
-                                HTCONDOR_JOB_FLAVOURS.items(), key=lambda key: key[1]
-                            )
-                        ]
-                    ),
+                    _htcondor_job_flavours_by_runtime,
                 ),
                 fg="red",
             )
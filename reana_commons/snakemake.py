@@ -10,29 +10,12 @@
 
 import os
 import sys
+from copy import deepcopy
+from functools import lru_cache
 from itertools import filterfalse, chain
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-if sys.version_info >= (3, 11):
-    from snakemake.api import SnakemakeApi
-    from snakemake.settings.types import (
-        ResourceSettings,
-        WorkflowSettings,
-        ConfigSettings,
-        OutputSettings,
-        StorageSettings,
-        DeploymentSettings,
-    )
-else:
-    from snakemake import snakemake
-    from snakemake.dag import DAG
-    from snakemake.io import load_configfile
-    from snakemake.jobs import Job
-    from snakemake.persistence import Persistence
-    from snakemake.rules import Rule
-    from snakemake.workflow import Workflow
-
 from reana_commons.errors import REANAValidationError
 from reana_commons.config import SNAKEMAKE_MAX_PARALLEL_JOBS
 
@@ -55,6 +38,14 @@ def snakemake_load(workflow_file: str, **kwargs: Any):
         return snakemake_load_v7(workflow_file, **kwargs)
 
 
+def snakemake_load_steps(workflow_file: str, **kwargs: Any):
+    """Load Snakemake specification steps, without computing job dependencies."""
+    if sys.version_info >= (3, 11):
+        return snakemake_load_v8(workflow_file, **kwargs)
+    else:
+        return snakemake_load_v7(workflow_file, job_dependencies=False, **kwargs)
+
+
 def snakemake_validate_v7(
     workflow_file: str, configfiles: List[str], workdir: Optional[str] = None
 ):
@@ -68,6 +59,8 @@ def snakemake_validate_v7(
     :param workdir: Path to working directory.
     :type workdir: string or None
     """
+    from snakemake import snakemake
+
     valid = snakemake(
         snakefile=workflow_file,
         configfiles=configfiles,
@@ -94,6 +87,16 @@ def snakemake_validate_v8(
     :param workdir: Path to working directory.
     :type workdir: string or None
     """
+    from snakemake.api import SnakemakeApi
+    from snakemake.settings.types import (
+        ConfigSettings,
+        DeploymentSettings,
+        OutputSettings,
+        ResourceSettings,
+        StorageSettings,
+        WorkflowSettings,
+    )
+
     with SnakemakeApi(
         OutputSettings(
             quiet=True,
@@ -118,23 +121,107 @@ def snakemake_validate_v8(
             raise REANAValidationError("Snakemake specification is invalid.")
 
 
-def snakemake_load_v7(workflow_file: str, **kwargs: Any):
+@lru_cache(maxsize=64)
+def _load_configfile(configfile, mtime_ns, size):
+    """Parse a Snakemake config file, cached by its path, mtime and size."""
+    from snakemake.io import load_configfile
+
+    return load_configfile(configfile)
+
+
+def _read_configfile(configfile: str) -> Dict[str, Any]:
+    """Load a Snakemake config file.
+
+    The parsed content is reused for as long as the file is not modified. A
+    copy is returned, as Snakemake may modify the loaded config.
+
+    :param configfile: Absolute path to the config file.
+    :type configfile: string
+    :returns: A dictionary which represents the config.
+    """
+    file_stat = os.stat(configfile)
+    return deepcopy(
+        _load_configfile(configfile, file_stat.st_mtime_ns, file_stat.st_size)
+    )
+
+
+def _get_snakemake_steps(rules) -> List[Dict[str, Any]]:
+    """Build the workflow steps out of the Snakemake rules that have to run.
+
+    :param rules: Snakemake rules of the workflow.
+    :type rules: Iterable
+    :returns: List of dictionaries, one for each step.
+    """
+    steps = []
+    for rule in rules:
+        if rule.norun:
+            continue
+        resources = rule.resources
+        container_img = rule._container_img
+        steps.append(
+            {
+                "name": rule.name,
+                "environment": (
+                    container_img.replace("docker://", "") if container_img else ""
+                ),
+                "inputs": dict(rule._input),
+                "params": dict(rule._params),
+                "outputs": dict(rule._output),
+                "commands": [rule.shellcmd],
+                "compute_backend": resources.get("compute_backend"),
+                "kubernetes_memory_limit": resources.get("kubernetes_memory_limit"),
+                "kubernetes_uid": resources.get("kubernetes_uid"),
+            }
+        )
+
+    return steps
+
+
+def _get_snakemake_job_dependencies(dag) -> Dict[str, List[str]]:
+    """Build the job dependencies out of the Snakemake DAG.
+
+    :param dag: Snakemake DAG of the workflow.
+    :type dag: snakemake.dag.DAG
+    :returns: Dictionary mapping each job to the list of jobs it depends on.
+    """
+    # the same job is usually a dependency of many others, so format each job
+    # only once
+    job_names = {}
+
+    def _job_name(job):
+        name = job_names.get(id(job))
+        if name is None:
+            name = job_names[id(job)] = str(job)
+        return name
+
+    return {
+        _job_name(job): [_job_name(dep) for dep in deps]
+        for job, deps in dag.dependencies.items()
+    }
+
+
+def snakemake_load_v7(workflow_file: str, job_dependencies: bool = True, **kwargs: Any):
     """Load Snakemake workflow specification into an internal representation. Used for python <3.11 and it is needed since snakemake8 dropped support for python 3.11.
 
     :param workflow_file: A specification file compliant with
         `snakemake` workflow specification.
     :type workflow_file: string
+    :param job_dependencies: Whether to build the DAG in order to compute the
+        job dependencies. If not, only the rules are loaded and checked, and
+        `job_dependencies` is returned empty.
+    :type job_dependencies: bool
 
     :returns: Dictonary containing relevant workflow metadata.
     """
+    from snakemake.dag import DAG
+    from snakemake.persistence import Persistence
+    from snakemake.rules import Rule
+    from snakemake.workflow import Workflow
 
-    def _create_snakemake_dag(
+    def _create_snakemake_workflow(
         snakefile: str, configfiles: Optional[List[str]] = None, **kwargs: Any
-    ) -> DAG:
-        """Create ``snakemake.dag.DAG`` instance.
-
-        The code of this function comes from the Snakemake codebase and is adapted
-        to fullfil REANA purposes of getting the needed metadata.
+    ) -> Workflow:
+        """Create ``snakemake.workflow.Workflow`` instance and load its rules.
 
         If `workdir` is passed as a keyword argument, then this function will change the
         CWD to `workdir`.
@@ -147,13 +234,14 @@ def snakemake_load_v7(workflow_file: str, **kwargs: Any):
         :type kwargs: Any
         """
         overwrite_config = dict()
-        if configfiles is None:
-            configfiles = []
-        for f in configfiles:
+        abs_configfiles = []
+        for f in configfiles or []:
+            # convert provided paths to absolute paths
+            f = os.path.abspath(f)
+            abs_configfiles.append(f)
             # get values to override. Later configfiles override earlier ones.
-            overwrite_config.update(load_configfile(f))
-        # convert provided paths to absolute paths
-        configfiles = list(map(os.path.abspath, configfiles))
+            overwrite_config.update(_read_configfile(f))
+        configfiles = abs_configfiles
         workflow = Workflow(
             snakefile=snakefile,
             overwrite_configfiles=configfiles,
@@ -166,32 +254,48 @@ def snakemake_load_v7(workflow_file: str, **kwargs: Any):
 
         workflow.include(snakefile=snakefile, overwrite_default_target=True)
         workflow.check()
+        return workflow
+
+    def _create_snakemake_dag(workflow: Workflow, **kwargs: Any) -> DAG:
+        """Create ``snakemake.dag.DAG`` instance.
+
+        The code of this function comes from the Snakemake codebase and is adapted
+        to fullfil REANA purposes of getting the needed metadata.
 
+        :param workflow: Workflow created by ``_create_snakemake_workflow``.
+        :type workflow: snakemake.workflow.Workflow
+        :param kwargs: Snakemake args.
+        :type kwargs: Any
+        """
         # code copied and adapted from `snakemake.workflow.Workflow.execute()`
         # in order to build the DAG and calculate the job dependencies.
         # https://github.com/snakemake/snakemake/blob/75a544ba528b30b43b861abc0ad464db4d6ae16f/snakemake/workflow.py#L525
-        def rules(items):
-            return map(
-                workflow._rules.__getitem__,
-                filter(workflow.is_rule, items),
-            )
-
         if kwargs.get("keep_target_files"):
 
-            def files(items):
-                return filterfalse(workflow.is_rule, items)
+            def relpath(f):
+                return f
 
         else:
-
-            def files(items):
-                def relpath(f):
-                    return (
-                        f
-                        if os.path.isabs(f) or f.startswith("root://")
-                        else os.path.relpath(f)
-                    )
-
-                return map(relpath, filterfalse(workflow.is_rule, items))
+            # the CWD does not change while the targets are collected, so look
+            # it up only once instead of on every `os.path.relpath` call
+            cwd = os.getcwd()
+
+            def relpath(f):
+                return (
+                    f
+                    if os.path.isabs(f) or f.startswith("root://")
+                    else os.path.relpath(os.path.join(cwd, f), cwd)
+                )
+
+        def partition(items):
+            """Split ``items`` into target rules and target files in one pass."""
+            item_rules, item_files = set(), set()
+            for item in items:
+                if workflow.is_rule(item):
+                    item_rules.add(workflow._rules[item])
+                else:
+                    item_files.add(relpath(item))
+            return item_rules, item_files
 
         if not kwargs.get("targets"):
             targets = (
@@ -200,29 +304,20 @@ def snakemake_load_v7(workflow_file: str, **kwargs: Any):
                 else list()
             )
 
-        prioritytargets = kwargs.get("prioritytargets", [])
-        forcerun = kwargs.get("forcerun", [])
-        until = kwargs.get("until", [])
-        omit_from = kwargs.get("omit_from", [])
-
-        priorityrules = set(rules(prioritytargets))
-        priorityfiles = set(files(prioritytargets))
-        forcerules = set(rules(forcerun))
-        forcefiles = set(files(forcerun))
-        untilrules = set(rules(until))
-        untilfiles = set(files(until))
-        omitrules = set(rules(omit_from))
-        omitfiles = set(files(omit_from))
-
-        targetrules = set(
+        priorityrules, priorityfiles = partition(kwargs.get("prioritytargets", []))
+        forcerules, forcefiles = partition(kwargs.get("forcerun", []))
+        untilrules, untilfiles = partition(kwargs.get("until", []))
+        omitrules, omitfiles = partition(kwargs.get("omit_from", []))
+        targetrules, targetfiles = partition(targets)
+
+        targetrules.update(
             chain(
-                rules(targets),
                 filterfalse(Rule.has_wildcards, priorityrules),
                 filterfalse(Rule.has_wildcards, forcerules),
                 filterfalse(Rule.has_wildcards, untilrules),
             )
         )
-        targetfiles = set(chain(files(targets), priorityfiles, forcefiles, untilfiles))
+        targetfiles.update(priorityfiles, forcefiles, untilfiles)
         dag = DAG(
             workflow,
             workflow.rules,
@@ -248,44 +343,32 @@ def snakemake_load_v7(workflow_file: str, **kwargs: Any):
 
     configfiles = [kwargs.get("input")] if kwargs.get("input") else []
 
-    snakemake_validate(
-        workflow_file=workflow_file, configfiles=configfiles, workdir=workdir
-    )
-
-    # save the cwd to restore it after _create_snakemake_dag, because this function
-    # changes the cwd if `workdir` is in `kwargs`
+    # save the cwd to restore it after _create_snakemake_workflow, because this
+    # function changes the cwd if `workdir` is in `kwargs`
     prev_cwd = os.getcwd()
     try:
-        snakemake_dag = _create_snakemake_dag(
+        workflow = _create_snakemake_workflow(
             workflow_file, configfiles=configfiles, **kwargs
         )
+        # building the DAG already validates the workflow, so there is no need
+        # to run a separate `snakemake_validate` dry run beforehand
+        snakemake_dag = (
+            _create_snakemake_dag(workflow, **kwargs) if job_dependencies else None
+        )
+    except Exception as e:
+        raise REANAValidationError(f"Snakemake specification is invalid: {e}")
     finally:
         os.chdir(prev_cwd)
 
-    job_dependencies = {
-        str(job): list(map(str, deps.keys()))
-        for job, deps in snakemake_dag.dependencies.items()
-    }
+    dependencies = (
+        _get_snakemake_job_dependencies(snakemake_dag)
+        if snakemake_dag is not None
+        else {}
+    )
 
     return {
-        "job_dependencies": job_dependencies,
-        "steps": [
-            {
-                "name": rule.name,
-                "environment": (rule._container_img or "").replace("docker://", ""),
-                "inputs": dict(rule._input),
-                "params": dict(rule._params),
-                "outputs": dict(rule._output),
-                "commands": [rule.shellcmd],
-                "compute_backend": rule.resources.get("compute_backend"),
-                "kubernetes_memory_limit": rule.resources.get(
-                    "kubernetes_memory_limit"
-                ),
-                "kubernetes_uid": rule.resources.get("kubernetes_uid"),
-            }
-            for rule in snakemake_dag.rules
-            if not rule.norun
-        ],
+        "job_dependencies": dependencies,
+        "steps": _get_snakemake_steps(workflow.rules),
     }
 
 
@@ -12,12 +12,32 @@ import json
 import logging
 import os
 import subprocess
+import threading
 import yaml
 
 from reana_commons.serial import serial_load
 from reana_commons.snakemake import snakemake_load
 from reana_commons.yadage import yadage_load
 
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Safe YAML loader, using the libyaml C bindings when they are available."""
+
+_cwltool_logger_lock = threading.Lock()
+"""Lock held while the level of the ``cwltool`` logger is changed."""
+
+
+def _read_yaml(filepath):
+    """Read and parse a YAML file.
+
+    The raw bytes are handed to the YAML parser, which detects the encoding
+    itself, so that the content does not go through a text-mode file first.
+
+    :param filepath: Path to the YAML file.
+    :returns: The parsed YAML content.
+    """
+    with open(filepath, "rb") as f:
+        return yaml.load(f.read(), Loader=YamlSafeLoader)
+
 
 def cwl_load(workflow_file, **kwargs):
     """Validate and return cwl workflow specification.
@@ -29,9 +49,46 @@ def cwl_load(workflow_file, **kwargs):
     basedir = kwargs.get("basedir")
     if basedir:
         workflow_file = os.path.join(basedir, workflow_file)
-    result = subprocess.check_output(["cwltool", "--pack", "--quiet", workflow_file])
-    value = result.decode("utf-8")
-    return json.loads(value)
+    try:
+        from cwltool.context import LoadingContext
+        from cwltool.load_tool import fetch_document, resolve_and_validate_document
+        from cwltool.pack import pack
+    except ImportError:
+        result = subprocess.check_output(
+            ["cwltool", "--pack", "--quiet", workflow_file]
+        )
+        value = result.decode("utf-8")
+        return json.loads(value)
+
+    # equivalent of `cwltool --quiet`, restoring the host's logger level after;
+    # the lock keeps concurrent loads from restoring each other's level
+    cwltool_logger = logging.getLogger("cwltool")
+    with _cwltool_logger_lock:
+        cwltool_log_level = cwltool_logger.level
+        cwltool_logger.setLevel(logging.WARNING)
+        try:
+            loading_context, workflowobj, uri = fetch_document(
+                os.path.abspath(workflow_file), LoadingContext()
+            )
+            loading_context, uri = resolve_and_validate_document(
+                loading_context, workflowobj, uri, preprocess_only=True
+            )
+            packed = pack(loading_context, uri)
+        finally:
+            cwltool_logger.setLevel(cwltool_log_level)
+    # same output as `cwltool --pack`, which unwraps single-process graphs
+    if len(packed["$graph"]) > 1:
+        return packed
+    return packed["$graph"][0]
+
+
+workflow_load = {
+    "yadage": yadage_load,
+    "cwl": cwl_load,
+    "serial": serial_load,
+    "snakemake": snakemake_load,
+}
+"""Dictionary to extend with new workflow specification loaders."""
 
 
 def load_workflow_spec(workflow_type, workflow_file, **kwargs):
@@ -42,14 +99,6 @@ def load_workflow_spec(workflow_type, workflow_file, **kwargs):
         specification.
     :returns: A dictionary which represents the valid workflow specification.
     """
-    workflow_load = {
-        "yadage": yadage_load,
-        "cwl": cwl_load,
-        "serial": serial_load,
-        "snakemake": snakemake_load,
-    }
-
-    """Dictionary to extend with new workflow specification loaders."""
     load_function = workflow_load.get(workflow_type)
     if load_function:
         return load_function(workflow_file, **kwargs)
@@ -112,8 +161,7 @@ def load_input_parameters(reana_yaml, workspace_path=None):
         if input_file:
             if workspace_path:
                 input_file = os.path.join(workspace_path, input_file)
-            with open(input_file) as f:
-                return yaml.safe_load(f)
+            return _read_yaml(input_file)
     return None
 
 
@@ -123,8 +171,7 @@ def load_reana_spec(filepath, workspace_path=None):
     :raises IOError: Error while reading REANA spec file from given `filepath`.
     """
     try:
-        with open(filepath) as f:
-            reana_yaml = yaml.safe_load(f)
+        reana_yaml = _read_yaml(filepath)
         reana_yaml["workflow"]["specification"] = load_workflow_spec_from_reana_yaml(
             reana_yaml, workspace_path
         )
@@ -11,139 +11,261 @@
 import datetime
 import json
 import logging
+import math
 import os
 import platform
+import re
+import shlex
 import shutil
 import stat
 import subprocess
 import sys
 import time
 import uuid
-from hashlib import md5
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import click
+import orjson
 import requests
+import wcmatch.glob
 
 from reana_commons import workspace
 from reana_commons.config import (
     REANA_COMPONENT_NAMING_SCHEME,
     REANA_COMPONENT_PREFIX,
     REANA_COMPONENT_TYPES,
+    REANA_DISK_USAGE_USE_DU,
+    REANA_FILE_ACCESS_TIME_STAT_WORKERS,
     REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP,
 )
-from reana_commons.errors import REANAMissingWorkspaceError
+from reana_commons.errors import REANAMissingWorkspaceError, REANAWorkspaceError
+
+try:
+    from hashlib import file_digest
+except ImportError:  # Python < 3.11
+    file_digest = None
 
 
 def click_table_printer(headers, _filter, data, colours=None):
     """Generate space separated output for click commands."""
-    _filter = [h.lower() for h in _filter] + [h.upper() for h in _filter]
-    header_indexes = [i for i, item in enumerate(headers)]
-    if _filter:
-        header_indexes = [
-            i for i, item in enumerate(headers) if item.upper() in _filter
-        ]
-    headers = [h for h in headers if not _filter or h in _filter]
-    # Maximum header width
-    header_widths = [len(h) for h in headers]
-
-    for row in data:
-        for i, idx in enumerate(header_indexes):
-            # If a row contains an element which is wider update maximum width
-            if header_widths[i] < len(str(row[idx])):
-                header_widths[i] = len(str(row[idx]))
-    # Prepare the format string with the maximum widths
-    formatted_output_parts = ["{{:<{0}}}".format(hw) for hw in header_widths]
-    formatted_output = "   ".join(formatted_output_parts)
-    # Print the table with the headers capitalized
-    click.echo(formatted_output.format(*[h.upper() for h in headers]))
-    colours = colours if len(colours or []) == len(data) else None
-    for i, row in enumerate(data):
-        if header_indexes:
-            row = [row[i] for i in header_indexes]
-        click.secho(
-            formatted_output.format(*row),
-            fg=colours[i] if colours else None,
+    _filter = {h.upper() for h in _filter}
+    header_indexes = [
+        i for i, item in enumerate(headers) if not _filter or item.upper() in _filter
+    ]
+    headers = [headers[i].upper() for i in header_indexes]
+    # Convert each cell to string only once
+    rows = [[str(row[i]) for i in header_indexes] for row in data]
+    # Maximum width of each column, including the header
+    header_widths = [max(map(len, column)) for column in zip(headers, *rows)]
+
+    def _format_row(row):
+        return "   ".join(
+            value.ljust(width) for value, width in zip(row, header_widths)
         )
 
-
-def calculate_hash_of_dir(directory, file_list=None):
-    """Calculate hash of directory."""
-    md5_hash = md5()
+    # Print the table with the headers capitalized
+    click.echo(_format_row(headers))
+    colours = colours if len(colours or []) == len(data) else None
+    if not colours:
+        # printing is much slower than formatting, so print all rows at once
+        if rows:
+            click.echo("\n".join(map(_format_row, rows)))
+        return
+    for row, colour in zip(rows, colours):
+        click.secho(_format_row(row), fg=colour)
+
+
+HASH_READ_CHUNK_SIZE = 1024 * 1024
+"""Size of the blocks in which files are read when calculating hashes."""
+
+HASH_DIGEST_SIZE = 16
+"""Size in bytes of the BLAKE2b digests of files, directories and jobs."""
+
+
+def _new_hash():
+    """Create a BLAKE2b hash object for hashing files, directories and jobs."""
+    return blake2b(digest_size=HASH_DIGEST_SIZE)
+
+
+def _calculate_hash_of_file(file_path):
+    """Calculate BLAKE2b hash of the content of a file."""
+    with open(file_path, "rb") as file_object:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                # files are read once from start to end, let the kernel read ahead
+                os.posix_fadvise(file_object.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        if file_digest is not None:
+            # read and hash the file in C, reusing the same buffer
+            return file_digest(file_object, _new_hash)
+        file_hash = _new_hash()
+        for buf in iter(lambda: file_object.read(HASH_READ_CHUNK_SIZE), b""):
+            file_hash.update(buf)
+        return file_hash
+
+
+def calculate_hash_of_dir(directory, file_list=None, fast=False):
+    """Calculate hash of directory.
+
+    The hash is the BLAKE2b of the BLAKE2b digests of the contents of the files
+    in the directory. If ``fast`` is set, the hash is instead calculated from the
+    relative path, size and modification time of each file, without reading
+    their contents.
+    """
+    dir_hash = _new_hash()
     if not os.path.exists(directory):
         return -1
 
-    sorted_by_dirs = sorted(list(os.walk(directory)), key=lambda x: x[2])
+    file_paths = []
+    for subdir, dirs, files in os.walk(directory):
+        # walk the directory in a fixed order, so that the hash is reproducible
+        dirs.sort()
+        for _file in sorted(files):
+            file_path = os.path.join(subdir, _file)
+            if file_list is not None and file_path not in file_list:
+                continue
+            file_paths.append(file_path)
+
+    if fast:
+        try:
+            for file_path in file_paths:
+                file_stat = os.stat(file_path)
+                dir_hash.update(
+                    "{}\0{}\0{}\n".format(
+                        os.path.relpath(file_path, directory),
+                        file_stat.st_size,
+                        file_stat.st_mtime_ns,
+                    ).encode()
+                )
+        except OSError:
+            return -1
+        return dir_hash.hexdigest()
+
+    def _calculate_hashes_of_files(file_paths):
+        return [_calculate_hash_of_file(file_path).digest() for file_path in file_paths]
+
+    # most of the time is spent waiting for I/O, so hash several files at once;
+    # files are handed out in batches to keep the overhead per file low, small
+    # enough for every worker to get some files when there are only a few
+    max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(file_paths)))
+    batch_size = max(1, min(64, math.ceil(len(file_paths) / max_workers)))
     try:
-        for subdir, dirs, files in sorted_by_dirs:
-            for _file in files:
-                file_path = os.path.join(subdir, _file)
-                if file_list is not None and file_path not in file_list:
-                    continue
-                try:
-                    _file_object = open(file_path, "rb")
-                except Exception:
-                    # You can't open the file for some reason
-                    _file_object.close()
-                    # We return -1 since we cannot ensure that the file that
-                    # can not be read, will not change from one execution to
-                    # another.
-                    return -1
-                while 1:
-                    # Read file in little chunks
-                    buf = _file_object.read(4096)
-                    if not buf:
-                        break
-                    md5_hash.update(md5(buf).hexdigest().encode())
-                _file_object.close()
+        # `map` keeps the order of the files, and thus the hash, stable
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for digests in executor.map(
+                _calculate_hashes_of_files,
+                [
+                    file_paths[i : i + batch_size]
+                    for i in range(0, len(file_paths), batch_size)
+                ],
+            ):
+                # hash each file separately, so that moving content from one
+                # file to the next one changes the hash of the directory
+                for digest in digests:
+                    dir_hash.update(digest)
     except Exception:
+        # We return -1 since we cannot ensure that a file that can not be
+        # read, will not change from one execution to another.
         return -1
-    return md5_hash.hexdigest()
+    return dir_hash.hexdigest()
 
 
 def calculate_job_input_hash(job_spec, workflow_json):
-    """Calculate md5 hash of job specification and workflow json."""
+    """Calculate BLAKE2b hash of job specification and workflow json.
+
+    Keys are sorted, so that the hash does not depend on the order in which
+    they were inserted.
+    """
     if "workflow_workspace" in job_spec:
         del job_spec["workflow_workspace"]
-    job_md5_buffer = md5()
-    job_md5_buffer.update(json.dumps(job_spec).encode("utf-8"))
-    job_md5_buffer.update(json.dumps(workflow_json).encode("utf-8"))
-    return job_md5_buffer.hexdigest()
+    job_hash = _new_hash()
+    job_hash.update(orjson.dumps(job_spec, option=orjson.OPT_SORT_KEYS))
+    job_hash.update(orjson.dumps(workflow_json, option=orjson.OPT_SORT_KEYS))
+    return job_hash.hexdigest()
+
+
+def _stat_or_none(stat_function, *args, **kwargs):
+    """Call ``stat_function``, returning None if the file cannot be reached.
+
+    Files are not reachable when they, or one of their parent directories, have
+    been deleted, or when a parent directory has been replaced by a symlink.
+    """
+    try:
+        return stat_function(*args, **kwargs)
+    except (FileNotFoundError, NotADirectoryError, REANAWorkspaceError):
+        return None
 
 
 def calculate_file_access_time(workflow_workspace):
     """Calculate access times of files in workspace."""
+    files = (
+        (file_path, entry)
+        for file_path, entry in workspace.scandir(workflow_workspace)
+        # the type of the entry is already known, so symlinks and directories
+        # are skipped without calling `lstat` on them
+        if not (entry.is_symlink() or entry.is_dir(follow_symlinks=False))
+    )
+    if REANA_FILE_ACCESS_TIME_STAT_WORKERS > 0:
+        # `stat` calls mostly wait for the filesystem, so several files are
+        # checked at once; entries are not valid anymore after the walk, so
+        # files are checked by path
+        file_paths = [file_path for file_path, _ in files]
+        with ThreadPoolExecutor(
+            max_workers=REANA_FILE_ACCESS_TIME_STAT_WORKERS
+        ) as executor:
+            file_stats = list(
+                zip(
+                    file_paths,
+                    executor.map(
+                        lambda file_path: _stat_or_none(
+                            workspace.lstat, workflow_workspace, file_path
+                        ),
+                        file_paths,
+                    ),
+                )
+            )
+    else:
+        file_stats = (
+            (file_path, _stat_or_none(entry.stat, follow_symlinks=False))
+            for file_path, entry in files
+        )
+
     access_times = {}
-    for file_path in workspace.walk(workflow_workspace, include_dirs=False):
-        try:
-            file_stat = workspace.lstat(workflow_workspace, file_path)
-        except FileNotFoundError:
+    for file_path, file_stat in file_stats:
+        if file_stat is None:
             logging.warn(
                 f"Could not get stats of '{file_path}' in '{workflow_workspace}' "
                 "while calculating access times. "
                 "Maybe file was deleted or moved?"
             )
             continue
-        if stat.S_ISLNK(file_stat.st_mode):
-            continue
         full_path = os.path.join(workflow_workspace, file_path)
         access_times[full_path] = file_stat.st_atime
     return access_times
 
 
+_OPENAPI_SPECS_FILE_NAMES = {
+    "reana-server": "reana_server.json",
+    "reana-workflow-controller": "reana_workflow_controller.json",
+    "reana-job-controller": "reana_job_controller.json",
+}
+"""Name of the OpenAPI specifications file of each REANA component."""
+
+
 def copy_openapi_specs(output_path, component):
     """Copy generated and validated openapi specs to reana-commons module."""
-    if component == "reana-server":
-        file = "reana_server.json"
-    elif component == "reana-workflow-controller":
-        file = "reana_workflow_controller.json"
-    elif component == "reana-job-controller":
-        file = "reana_job_controller.json"
-    if os.environ.get("REANA_SRCDIR"):
-        reana_srcdir = os.environ.get("REANA_SRCDIR")
-    else:
-        reana_srcdir = os.path.join("..")
+    if component not in _OPENAPI_SPECS_FILE_NAMES:
+        raise ValueError(
+            "{} has no OpenAPI specifications.\nChoose one of: {}".format(
+                component, list(_OPENAPI_SPECS_FILE_NAMES)
+            )
+        )
+    file = _OPENAPI_SPECS_FILE_NAMES[component]
+    reana_srcdir = os.environ.get("REANA_SRCDIR") or ".."
     try:
         reana_commons_specs_path = os.path.join(
             reana_srcdir, "reana-commons", "reana_commons", "openapi_specifications"
@@ -178,18 +300,15 @@ def build_progress_message(
     total=None, running=None, finished=None, failed=None, cached=None
 ):
     """Build the progress message with correct formatting."""
-    progress_message = {}
-    if total:
-        progress_message["total"] = total
-    if running:
-        progress_message["running"] = running
-    if finished:
-        progress_message["finished"] = finished
-    if failed:
-        progress_message["failed"] = failed
-    if cached:
-        progress_message["cached"] = cached
-    return progress_message
+    progress_message = {
+        "total": total,
+        "running": running,
+        "finished": finished,
+        "failed": failed,
+        "cached": cached,
+    }
+    # only keep the counts that are set
+    return {key: value for key, value in progress_message.items() if value}
 
 
 def build_caching_info_message(
@@ -211,24 +330,43 @@ def run_command(cmd, display=True, return_output=False, stderr_output=False):
 
     Exit in case of troubles.
 
-    :param cmd: shell command to run
+    :param cmd: shell command to run, or list of program arguments to run
+        the program directly, without spawning a shell
     :param display: should we display command to run?
     :param return_output: shall the output of the command be returned?
-    :type cmd: str
+    :type cmd: str or list
     :type display: bool
     :type return_output: bool
     """
+    # only strings may need the shell, e.g. for pipes or redirections
+    shell = isinstance(cmd, str)
     now = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if display:
         click.secho("[{0}] ".format(now), bold=True, nl=False, fg="green")
-        click.secho("{0}".format(cmd), bold=True)
+        click.secho("{0}".format(cmd if shell else shlex.join(cmd)), bold=True)
     try:
-        if return_output:
-            stderr_flag_val = subprocess.STDOUT if stderr_output else None
-            result = subprocess.check_output(cmd, stderr=stderr_flag_val, shell=True)
-            return result.decode().rstrip("\r\n")
-        else:
-            subprocess.check_call(cmd, shell=True)
+        try:
+            if return_output:
+                stderr_flag_val = subprocess.STDOUT if stderr_output else None
+                result = subprocess.check_output(
+                    cmd, stderr=stderr_flag_val, shell=shell
+                )
+                return result.decode().rstrip("\r\n")
+            else:
+                subprocess.check_call(cmd, shell=shell)
+        except OSError as err:
+            # the program could not be started, fail as the shell would do:
+            # exit code 127 if it is not found, 126 if it cannot be executed
+            if isinstance(err, FileNotFoundError):
+                returncode, reason = 127, "not found"
+            else:
+                returncode, reason = 126, err.strerror
+            message = "{0}: {1}\n".format(cmd if shell else cmd[0], reason)
+            if not (return_output and stderr_output):
+                click.echo(message, err=True, nl=False)
+            raise subprocess.CalledProcessError(
+                returncode, cmd, output=message.encode()
+            ) from err
     except subprocess.CalledProcessError as err:
         if display:
             click.secho("[{0}] ".format(now), bold=True, nl=False, fg="green")
@@ -272,8 +410,9 @@ def get_files_recursive_wildcard(directory_path, path):
     :return: list of paths sorted by length.
     """
     secure_path = remove_upper_level_references(path)
-    # if `secure_path` is a directory, append `/*` to get all the files inside
-    if is_directory(directory_path, secure_path):
+    # if `secure_path` is a directory, append `/*` to get all the files inside;
+    # the path is already sanitized, so it is checked directly
+    if Path(directory_path, secure_path).is_dir():
         _rstrip_path = secure_path.rstrip("/")
         secure_path = "{}/*".format(_rstrip_path)
     posix_dir_prefix = Path(directory_path)
@@ -283,6 +422,166 @@ def get_files_recursive_wildcard(directory_path, path):
     return paths, posix_dir_prefix
 
 
+def _get_paths_matching_any_wildcard(directory_path, patterns):
+    """Get the paths in the workspace matching any of the given wildcards.
+
+    Patterns without wildcards are checked directly, while all the other patterns
+    are matched by walking the directory given by their longest prefix without
+    wildcards. Patterns sharing the same prefix are matched in a single walk. In
+    both cases symlinks are not followed, so paths going through them are not
+    matched.
+
+    :param directory_path: Directory to get files from.
+    :param patterns: Wildcard patterns to use for the extraction.
+    :return: List of unique paths sorted by length.
+    """
+    flags = wcmatch.glob.GLOBSTAR | wcmatch.glob.DOTGLOB
+    # dict used as an ordered set, to avoid returning the same path twice
+    paths = {}
+    regexes_by_root = {}
+    for pattern in patterns:
+        secure_path = remove_upper_level_references(pattern)
+        # if `secure_path` is a directory, append `/*` to get all the files inside
+        if workspace.is_directory(directory_path, secure_path):
+            secure_path = os.path.join(secure_path, "*")
+        if wcmatch.glob.is_magic(secure_path, flags=flags):
+            root_parts = []
+            for part in secure_path.split("/"):
+                if wcmatch.glob.is_magic(part, flags=flags):
+                    break
+                root_parts.append(part)
+            include_regex, _ = wcmatch.glob.translate(secure_path, flags=flags)
+            regexes_by_root.setdefault("/".join(root_parts), []).extend(
+                re.compile(regex) for regex in include_regex
+            )
+        elif secure_path and _stat_or_none(
+            workspace.lstat, directory_path, secure_path
+        ):
+            paths[secure_path] = None
+    for root, regexes in regexes_by_root.items():
+        # the root itself never matches, as wildcards need at least one more level
+        if root and not workspace.is_directory(directory_path, root):
+            continue
+        for path in workspace.walk(directory_path, root):
+            if any(regex.match(path) for regex in regexes):
+                paths[path] = None
+    # sort paths by length to start with the leaves of the directory tree
+    return sorted(
+        (os.path.join(directory_path, path) for path in paths), key=len, reverse=True
+    )
+
+
+def _calculate_disk_usage(path, file_stat, summarize, hash_all, seen_inodes):
+    """Calculate the disk usage of a path, in the same way as ``du`` does.
+
+    Sizes are the number of bytes allocated on disk, symlinks are not followed,
+    and directories and hard-linked files are only counted the first time they
+    are found.
+
+    :param path: Path to the file or directory.
+    :param file_stat: Result of ``lstat`` on ``path``.
+    :param summarize: Whether to skip returning the contents of directories.
+    :param hash_all: Whether every file should only be counted the first time it
+        is found, as ``du`` does when given more than one path.
+    :param seen_inodes: Set of ``(st_dev, st_ino)`` of the entries already counted.
+
+    :return: Generator of ``(path, size)`` pairs for the contents of ``path``,
+        each returned as soon as its size is known. The value of the generator
+        is the total size of ``path``, or None if it was already counted.
+    """
+    is_dir = stat.S_ISDIR(file_stat.st_mode)
+    if hash_all or is_dir or file_stat.st_nlink > 1:
+        inode = (file_stat.st_dev, file_stat.st_ino)
+        if inode in seen_inodes:
+            return None
+        seen_inodes.add(inode)
+    size = file_stat.st_blocks * 512
+    if not is_dir:
+        return size
+    # directories are walked with an explicit stack instead of recursing, as
+    # workspaces can be nested deeper than the recursion limit; every item of
+    # the stack holds the path, the remaining entries and the size so far
+    with os.scandir(path) as it:
+        stack = [[path, iter(list(it)), size]]
+    while True:
+        directory = stack[-1]
+        for entry in directory[1]:
+            entry_stat = entry.stat(follow_symlinks=False)
+            if entry.is_dir(follow_symlinks=False):
+                inode = (entry_stat.st_dev, entry_stat.st_ino)
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+                with os.scandir(entry.path) as it:
+                    stack.append(
+                        [entry.path, iter(list(it)), entry_stat.st_blocks * 512]
+                    )
+                # continue with the entries of the subdirectory
+                break
+            if hash_all or entry_stat.st_nlink > 1:
+                inode = (entry_stat.st_dev, entry_stat.st_ino)
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+            entry_size = entry_stat.st_blocks * 512
+            directory[2] += entry_size
+            if not summarize:
+                yield entry.path, entry_size
+        else:
+            # all the entries of the directory have been counted
+            stack.pop()
+            if not stack:
+                return directory[2]
+            stack[-1][2] += directory[2]
+            if not summarize:
+                yield directory[0], directory[2]
+
+
+def _iter_disk_usage_info_paths(absolute_path, summarize, name_filter):
+    """Iterate over the disk usage of the paths in a directory.
+
+    :param absolute_path: System path to reana filesystem.
+    :param summarize: Whether to return only the total size of each path.
+    :param name_filter: Name filter parameters if any.
+
+    :return: Generator of ``(path, size)`` pairs.
+    """
+    if name_filter:
+        path_list = _get_paths_matching_any_wildcard(absolute_path, name_filter)
+    else:
+        path_list = [absolute_path]
+    if not path_list:
+        return
+    if REANA_DISK_USAGE_USE_DU:
+        command = ["du", "-s" if summarize else "-a"]
+        if "Darwin" not in platform.system():
+            command.append("--block-size=1")
+        # read the output while `du` is running, so that every entry is returned
+        # as soon as it is printed instead of after walking the whole directory
+        with subprocess.Popen(command + path_list, stdout=subprocess.PIPE) as process:
+            try:
+                # every line contains the size and the path, separated by a tab
+                for line in process.stdout:
+                    size, name = line.rstrip(b"\n").decode().split("\t", 1)
+                    yield name, int(size)
+            except GeneratorExit:
+                # the caller stopped iterating, there is no need to walk further
+                process.kill()
+                raise
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
+        return
+
+    seen_inodes = set()
+    hash_all = len(path_list) > 1
+    for path in map(str, path_list):
+        size = yield from _calculate_disk_usage(
+            path, os.lstat(path), summarize, hash_all, seen_inodes
+        )
+        if size is not None:
+            yield path, size
+
+
 def get_disk_usage_info_paths(absolute_path, command, name_filter):
     """Retrieve the path for disk usage information.
 
@@ -310,10 +609,13 @@ def get_disk_usage_info_paths(absolute_path, command, name_filter):
     return disk_usage_info
 
 
-def get_disk_usage(
+def get_disk_usage_iter(
     directory, summarize=False, search=None, to_human_readable_units=None
 ):
-    """Retrieve directory disk usage information.
+    """Iterate over directory disk usage information.
+
+    Same as ``get_disk_usage``, but each entry is returned as soon as its size is
+    known, instead of after walking the whole directory.
 
     :param directory: Disk usage directory.
     :param summarize: Displays a total size of a directory.
@@ -321,17 +623,10 @@ def get_disk_usage(
     :param to_human_readable_units: Callback to transform bytes to human
         readable units.
 
-    :return: List of dicts with file name and size.
+    :return: Generator of dicts with file name and size.
     """
     if not os.path.exists(directory):
         raise REANAMissingWorkspaceError("Directory does not exist.")
-    command = ["du"]
-    if summarize:
-        command.append("-s")
-    else:
-        command.append("-a")
-    if "Darwin" not in platform.system():
-        command.append("--block-size=1")
 
     name_filter = None
     size_filter = None
@@ -339,14 +634,16 @@ def get_disk_usage(
         search = json.loads(search)
         name_filter = search.get("name")
         size_filter = search.get("size")
-
-    disk_usage_info = get_disk_usage_info_paths(directory, command, name_filter)
-    if disk_usage_info:
-        filesize_pairs = list(zip(disk_usage_info[::2], disk_usage_info[1::2]))
-        filesizes = []
-        for filesize_pair in filesize_pairs:
-            size, name = filesize_pair
-            size = int(size)
+        if isinstance(size_filter, list):
+            # the size of every file is checked, so look sizes up in a set
+            size_filter = set(size_filter)
+
+    def _iter_file_data():
+        for name, size in _iter_disk_usage_info_paths(
+            directory, summarize, name_filter
+        ):
+            if size_filter and str(size) not in size_filter:
+                continue
             # trim workspace path in every file name, and transform bytes if necessary
             file_data = {
                 "name": name[len(directory) :],
@@ -354,13 +651,27 @@ def get_disk_usage(
             }
             if to_human_readable_units:
                 file_data["size"]["human_readable"] = to_human_readable_units(size)
-            if size_filter:
-                if str(size) in size_filter:
-                    filesizes.append(file_data)
-            else:
-                filesizes.append(file_data)
-        return filesizes
-    return disk_usage_info
+            yield file_data
+
+    return _iter_file_data()
+
+
+def get_disk_usage(
+    directory, summarize=False, search=None, to_human_readable_units=None
+):
+    """Retrieve directory disk usage information.
+
+    :param directory: Disk usage directory.
+    :param summarize: Displays a total size of a directory.
+    :param search: Filter parameters to show only files that match certain filtering.
+    :param to_human_readable_units: Callback to transform bytes to human
+        readable units.
+
+    :return: List of dicts with file name and size.
+    """
+    return list(
+        get_disk_usage_iter(directory, summarize, search, to_human_readable_units)
+    )
 
 
 def format_cmd(cmd):
@@ -375,20 +686,36 @@ def format_cmd(cmd):
 
 
 def check_connection_to_job_controller(port=5000):
-    """Check connection from workflow engine to job controller."""
+    """Check connection from workflow engine to job controller.
+
+    The job controller is checked with exponential backoff, starting from one
+    second and up to `REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP` seconds
+    between checks, for at most five times that amount of time in total,
+    including the time spent waiting for responses. Every check waits for at
+    least one second, so the last one can take up to one second longer.
+    """
     url = "http://localhost:{}/jobs".format(port)
-    retry_counter = 0
-    while retry_counter < 5:
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
+    deadline = time.monotonic() + 5 * REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP
+    sleep = min(1, REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP)
+    with requests.Session() as session:
+        while True:
+            try:
+                timeout = min(10, max(deadline - time.monotonic(), 1))
+                response = session.get(url, timeout=timeout)
+                if response.status_code == 200:
+                    return
+            except Exception:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-        except Exception:
-            pass
-        time.sleep(REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP)
-        retry_counter += 1
-    else:
-        logging.error("Job controller is not reachable.", exc_info=True)
+            time.sleep(min(sleep, remaining))
+            sleep = min(2 * sleep, REANA_JOB_CONTROLLER_CONNECTION_CHECK_SLEEP)
+    logging.error("Job controller is not reachable.", exc_info=True)
+
+
+_REANA_COMPONENT_TYPES_SET = frozenset(REANA_COMPONENT_TYPES)
+"""Set of ``REANA_COMPONENT_TYPES``, to validate component types in O(1)."""
 
 
 def build_unique_component_name(component_type, id=None):
@@ -400,7 +727,7 @@ def build_unique_component_name(component_type, id=None):
 
     :return: String representing the component name, i.e. reana-run-job-123456.
     """
-    if component_type not in REANA_COMPONENT_TYPES:
+    if component_type not in _REANA_COMPONENT_TYPES_SET:
         raise ValueError(
             "{} not valid component type.\nChoose one of: {}".format(
                 component_type, REANA_COMPONENT_TYPES
@@ -22,26 +22,12 @@ def build_compute_backends_validator(
     :param supported_backends: a list of the supported compute backends.
     """
     workflow = reana_yaml["workflow"]
-    workflow_type = workflow["type"]
-    if workflow_type == "serial":
-        workflow_steps = workflow["specification"]["steps"]
-        return ComputeBackendValidatorSerial(
-            workflow_steps=workflow_steps, supported_backends=supported_backends
-        )
-    if workflow_type == "yadage":
-        workflow_steps = workflow["specification"]["stages"]
-        return ComputeBackendValidatorYadage(
-            workflow_steps=workflow_steps, supported_backends=supported_backends
-        )
-    if workflow_type == "cwl":
-        workflow_steps = workflow.get("specification", {}).get("$graph", workflow)
-        return ComputeBackendValidatorCWL(
-            workflow_steps=workflow_steps, supported_backends=supported_backends
-        )
-    if workflow_type == "snakemake":
-        workflow_steps = workflow["specification"]["steps"]
-        return ComputeBackendValidatorSnakemake(
-            workflow_steps=workflow_steps, supported_backends=supported_backends
+    validator = _compute_backend_validators.get(workflow["type"])
+    if validator:
+        validator_class, get_workflow_steps = validator
+        return validator_class(
+            workflow_steps=get_workflow_steps(workflow),
+            supported_backends=supported_backends,
         )
 
 
@@ -60,6 +46,8 @@ class ComputeBackendValidatorBase:
         """
         self.workflow_steps = workflow_steps
         self.supported_backends = supported_backends
+        # set of the supported backends, to check every step in O(1)
+        self._supported_backends = frozenset(supported_backends or ())
 
     def validate(self) -> None:
         """Validate compute backends in REANA workflow."""
@@ -80,7 +68,7 @@ class ComputeBackendValidatorSerial(ComputeBackendValidatorBase):
         """Validate compute backends in REANA serial workflow."""
         for step in self.workflow_steps:
             backend = step.get("compute_backend")
-            if backend and backend not in self.supported_backends:
+            if backend and backend not in self._supported_backends:
                 self.raise_error(backend, step.get("name"))
 
 
@@ -89,27 +77,26 @@ class ComputeBackendValidatorYadage(ComputeBackendValidatorBase):
 
     def validate(self) -> None:
         """Validate compute backends in REANA Yadage workflow."""
-
-        def parse_stages(stages: Optional[List[Dict]]) -> None:
-            """Extract compute backends in Yadage workflow steps."""
-            for stage in stages:
-                if "workflow" in stage["scheduler"]:
-                    nested_stages = stage["scheduler"]["workflow"].get("stages", {})
-                    parse_stages(nested_stages)
-                else:
-                    environment = stage["scheduler"]["step"]["environment"]
-                    backend = next(
-                        (
-                            resource["compute_backend"]
-                            for resource in environment.get("resources", [])
-                            if "compute_backend" in resource
-                        ),
-                        None,
-                    )
-                    if backend and backend not in self.supported_backends:
-                        self.raise_error(backend, stage["name"])
-
-        return parse_stages(self.workflow_steps)
+        # walk nested workflows with an explicit stack instead of recursing;
+        # stages are pushed in reverse, so that they are checked in order
+        stages = list(reversed(self.workflow_steps))
+        while stages:
+            stage = stages.pop()
+            if "workflow" in stage["scheduler"]:
+                nested_stages = stage["scheduler"]["workflow"].get("stages", [])
+                stages.extend(reversed(nested_stages))
+                continue
+            environment = stage["scheduler"]["step"]["environment"]
+            backend = next(
+                (
+                    resource["compute_backend"]
+                    for resource in environment.get("resources", [])
+                    if "compute_backend" in resource
+                ),
+                None,
+            )
+            if backend and backend not in self._supported_backends:
+                self.raise_error(backend, stage["name"])
 
 
 class ComputeBackendValidatorCWL(ComputeBackendValidatorBase):
@@ -131,7 +118,7 @@ class ComputeBackendValidatorCWL(ComputeBackendValidatorBase):
                 hints = step.get("hints", [])
                 reana_hints = _get_reana_hints(hints)
                 backend = reana_hints.get("compute_backend")
-                if backend and backend not in self.supported_backends:
+                if backend and backend not in self._supported_backends:
                     self.raise_error(backend, step.get("id"))
 
         workflow = self.workflow_steps
@@ -149,6 +136,27 @@ class ComputeBackendValidatorSnakemake(ComputeBackendValidatorBase):
         """Validate compute backends in REANA Snakemake workflow."""
         for idx, step in enumerate(self.workflow_steps):
             backend = step.get("compute_backend")
-            if backend and backend not in self.supported_backends:
+            if backend and backend not in self._supported_backends:
                 step_name = step.get("name", str(idx))
                 self.raise_error(backend, step_name)
+
+
+_compute_backend_validators = {
+    "serial": (
+        ComputeBackendValidatorSerial,
+        lambda workflow: workflow["specification"]["steps"],
+    ),
+    "yadage": (
+        ComputeBackendValidatorYadage,
+        lambda workflow: workflow["specification"]["stages"],
+    ),
+    "cwl": (
+        ComputeBackendValidatorCWL,
+        lambda workflow: workflow.get("specification", {}).get("$graph", workflow),
+    ),
+    "snakemake": (
+        ComputeBackendValidatorSnakemake,
+        lambda workflow: workflow["specification"]["steps"],
+    ),
+}
+"""Validator class and workflow steps getter for each workflow type."""
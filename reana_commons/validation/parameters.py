@@ -16,6 +16,15 @@ from collections import defaultdict
 from reana_commons.config import COMMAND_DANGEROUS_OPERATIONS
 from reana_commons.errors import REANAValidationError
 
+_SERIAL_PARAM_RE = re.compile(r"\$\{(.*?)\}")
+"""Regex matching the ``${param}`` parameters of Serial commands."""
+
+_YADAGE_PARAM_RE = re.compile(r"\{+(.*?)\}+")
+"""Regex matching the ``{param}`` parameters of Yadage step definitions."""
+
+_SNAKEMAKE_PARAM_RE = re.compile(r"\{(?:params|input|output)\.(.*?)\}")
+"""Regex matching the ``{params.x}``, ``{input.x}`` and ``{output.x}`` of Snakemake."""
+
 
 def build_parameters_validator(reana_yaml):
     """Validate the presence of input parameters in workflow step commands and viceversa.
@@ -77,12 +86,14 @@ class ParameterValidatorBase:
         :param commands: A workflow step command list to validate.
         :param step: The workflow step that contains the given command.
         """
+        msg = 'Operation "{}" found in step "{}" might be dangerous.'
+        if not step:
+            msg = 'Operation "{}" might be dangerous.'
         for command in commands:
+            # commands are not always strings, so convert them only once
+            command = str(command)
             for operation in COMMAND_DANGEROUS_OPERATIONS:
-                if operation in str(command):
-                    msg = 'Operation "{}" found in step "{}" might be dangerous.'
-                    if not step:
-                        msg = 'Operation "{}" might be dangerous.'
+                if operation in command:
                     self.operations_warnings.append(
                         {
                             "type": "warning",
@@ -210,17 +221,6 @@ class ParameterValidatorSerial(ParameterValidatorBase):
 
     def parse_specification(self):
         """Parse serial workflow tree."""
-
-        def parse_command(command):
-            return re.findall(r".*?\${(.*?)}.*?", command)
-
-        def parse_commands(commands):
-            cmd_list = set()
-            for command in commands:
-                for cmd in parse_command(command):
-                    cmd_list.add(cmd)
-            return cmd_list
-
         steps = []
         for idx, step in enumerate(self.specification.get("steps", [])):
             commands = step["commands"]
@@ -229,7 +229,11 @@ class ParameterValidatorSerial(ParameterValidatorBase):
                     "name": step.get("name", str(idx)),
                     "commands": commands,
                     "input_params": [],
-                    "command_params": parse_commands(commands),
+                    "command_params": {
+                        param
+                        for command in commands
+                        for param in _SERIAL_PARAM_RE.findall(command)
+                    },
                 }
             )
         return steps
@@ -267,9 +271,6 @@ class ParameterValidatorYadage(ParameterValidatorBase):
     def parse_specification(self):
         """Parse Yadage workflow tree."""
 
-        def parse_command(command):
-            return re.findall(r".*?\{+(.*?)\}+.*?", command)
-
         def parse_command_params(step_value):
             if isinstance(step_value, dict):
                 step_value = list(step_value.values())
@@ -279,7 +280,7 @@ class ParameterValidatorYadage(ParameterValidatorBase):
                     value.values() if isinstance(value, dict) else value
                     for value in step_value
                 ]
-            return set(parse_command(str(step_value)))
+            return set(_YADAGE_PARAM_RE.findall(str(step_value)))
 
         def get_publisher_definitions(step, step_key, step_val):
             """Save publisher definitions as command params."""
@@ -372,7 +373,7 @@ class ParameterValidatorCWL(ParameterValidatorBase):
         cwl_main_spec_path = self.reana_yaml["workflow"].get("file")
         if os.path.exists(cwl_main_spec_path):
             run_command(
-                "cwltool --validate --strict {}".format(cwl_main_spec_path),
+                ["cwltool", "--validate", "--strict", cwl_main_spec_path],
                 display=False,
                 return_output=True,
                 stderr_output=True,
@@ -423,17 +424,6 @@ class ParameterValidatorSnakemake(ParameterValidatorBase):
 
     def parse_specification(self):
         """Parse Snakemake workflow tree."""
-
-        def parse_command(command):
-            return re.findall(r".*?{(?:params|input|output)\.(.*?)}.*?", command)
-
-        def parse_commands(commands):
-            cmd_list = set()
-            for command in commands:
-                for cmd in parse_command(command):
-                    cmd_list.add(cmd)
-            return cmd_list
-
         steps = []
         for idx, step in enumerate(self.specification.get("steps", [])):
             commands = step["commands"]
@@ -448,7 +438,11 @@ class ParameterValidatorSnakemake(ParameterValidatorBase):
                             *step.get("outputs", {}).keys(),
                         ]
                     ),
-                    "command_params": parse_commands(commands),
+                    "command_params": {
+                        param
+                        for command in commands
+                        for param in _SNAKEMAKE_PARAM_RE.findall(command)
+                    },
                 }
             )
         return steps
@@ -10,7 +10,7 @@ import os
 import re
 import stat
 from pathlib import Path
-from typing import Generator, Union
+from typing import Generator, Tuple, Union
 
 import wcmatch.glob
 
@@ -198,6 +198,46 @@ def walk(
         os.close(root_fd)
 
 
+def _scandir_fd(
+    dir_fd: int, path: Path
+) -> Generator[Tuple[str, os.DirEntry], None, None]:
+    """Recursively iterate over the entries of an open directory."""
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+    for entry in entries:
+        yield str(path / entry.name), entry
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        try:
+            subdir_fd = _open_single_component(
+                entry.name, dir_fd=dir_fd, flags=READ_SAFE_FLAGS | os.O_DIRECTORY
+            )
+        except (FileNotFoundError, NotADirectoryError, REANAWorkspaceError):
+            # we skip this directory, as it was deleted or replaced
+            continue
+        try:
+            yield from _scandir_fd(subdir_fd, path / entry.name)
+        finally:
+            os.close(subdir_fd)
+
+
+def scandir(
+    workspace: PathLike, path: PathLike = ""
+) -> Generator[Tuple[str, os.DirEntry], None, None]:
+    """Recursively iterate over the entries inside a workspace.
+
+    Symlinks are returned but never followed. Each path is returned together with
+    its ``os.DirEntry``, which caches the type of the entry and whose ``stat`` is
+    relative to the fd of its parent directory. The ``os.DirEntry`` is only valid
+    until the next entry is requested.
+    """
+    dir_fd = open_fd(workspace, path)
+    try:
+        yield from _scandir_fd(dir_fd, Path(path))
+    finally:
+        os.close(dir_fd)
+
+
 def iterdir(workspace: PathLike, path: PathLike) -> Generator[str, None, None]:
     """Iterate over the contents of a directory."""
     dir_fd = open_fd(workspace, path)
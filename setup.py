@@ -64,6 +64,7 @@ install_requires = [
     "jsonschema[format]>=3.0.1",
     "kombu>=4.6",
     "mock>=3.0,<4",
+    "orjson>=3.8,<4",
     "PyYAML>=5.1,<7.0",
     "Werkzeug>=0.14.1",
     "wcmatch>=8.3,<8.5",
@@ -8,9 +8,9 @@
 
 """REANA-Commons message queue publisher tests."""
 
-import json
 import threading
 
+import orjson
 import pytest
 from kombu import Connection, Exchange, Queue
 from kombu.exceptions import OperationalError
@@ -72,8 +72,8 @@ def test_workflow_status_publish(
         workflow_id, status, message=message
     )
     workflow_status_publisher.close()
-    expected = json.dumps(
+    expected = orjson.dumps(
         {"workflow_uuid": workflow_id, "logs": "", "status": status, "message": message}
-    )
+    ).decode()
     consume_queue(consumer, limit=1)
     consumer.on_message.assert_called_once_with(expected, ANY)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Commons Serial workflow utils tests."""
+
+import json
+import os
+
+import pytest
+from jsonschema import ValidationError
+
+from reana_commons.serial import check_htcondor_max_runtime, serial_load
+
+
+@pytest.fixture()
+def serial_specification():
+    """Get a dummy Serial workflow specification."""
+    return {
+        "steps": [
+            {
+                "name": "first",
+                "environment": "docker.io/library/python:3.8-slim",
+                "commands": ["echo ${message}", "mkdir -p $outdir"],
+            },
+            {
+                "environment": "docker.io/library/python:3.8-slim",
+                "commands": ["touch ${outdir}/done"],
+            },
+        ]
+    }
+
+
+def test_serial_load_expands_parameters(serial_specification):
+    """Test that parameters are expanded in every step command."""
+    expanded = serial_load(
+        None,
+        serial_specification,
+        parameters={"message": "hello", "outdir": "results"},
+    )
+    assert [step["commands"] for step in expanded["steps"]] == [
+        ["echo hello", "mkdir -p results"],
+        ["touch results/done"],
+    ]
+    # the given specification is left untouched
+    assert serial_specification["steps"][0]["commands"][0] == "echo ${message}"
+
+
+def test_serial_load_original(serial_specification):
+    """Test that the original specification is returned when requested."""
+    assert serial_load(None, serial_specification, original=True) == (
+        serial_specification
+    )
+
+
+def test_serial_load_missing_parameter(serial_specification):
+    """Test that a missing parameter raises a validation error."""
+    with pytest.raises(ValidationError):
+        serial_load(None, serial_specification, parameters={"message": "hello"})
+
+
+def test_serial_load_invalid_specification():
+    """Test that a specification not following the schema is rejected."""
+    with pytest.raises(ValidationError):
+        serial_load(None, {"steps": [{"commands": []}]}, original=True)
+
+
+def test_serial_load_from_file(tmp_path, serial_specification):
+    """Test loading the specification from a workflow file."""
+    workflow_file = tmp_path / "workflow.json"
+    workflow_file.write_text(json.dumps(serial_specification))
+    parameters = {"message": "hello", "outdir": "results"}
+
+    expanded = serial_load(str(workflow_file), None, parameters=parameters)
+    assert expanded["steps"][1]["commands"] == ["touch results/done"]
+    # loading again gives the same result, and is not affected by the
+    # previous call
+    assert serial_load(str(workflow_file), None, parameters=parameters) == expanded
+
+    original = serial_load(str(workflow_file), None, original=True)
+    assert original == serial_specification
+    original["steps"].pop()
+    assert serial_load(str(workflow_file), None, original=True) == (
+        serial_specification
+    )
+
+    # modifying the file is picked up
+    serial_specification["steps"].pop()
+    workflow_file.write_text(json.dumps(serial_specification))
+    os.utime(workflow_file, ns=(0, 0))
+    assert serial_load(str(workflow_file), None, original=True) == (
+        serial_specification
+    )
+
+
+def test_check_htcondor_max_runtime(capsys):
+    """Test validation of the htcondor_max_runtime step field."""
+    specification = {
+        "steps": [
+            {"commands": ["true"], "htcondor_max_runtime": "3600"},
+            {"commands": ["true"], "htcondor_max_runtime": "espresso"},
+            {"commands": ["true"]},
+        ]
+    }
+    assert check_htcondor_max_runtime(specification)
+
+    specification["steps"].append(
+        {"name": "slow", "commands": ["true"], "htcondor_max_runtime": "forever"}
+    )
+    assert not check_htcondor_max_runtime(specification)
+    out, _ = capsys.readouterr()
+    assert "In step slow:\n'forever' is not a valid input" in out
+    assert "'espresso' 'microcentury' 'longlunch' 'workday'" in out
+
+
+def test_serial_load_without_parameters():
+    """Test expanding a specification when no parameters are given."""
+    specification = {"steps": [{"commands": ["ls -l", "echo $$HOME"]}]}
+    expanded = serial_load(None, specification)
+    assert expanded["steps"][0]["commands"] == ["ls -l", "echo $HOME"]
+
+    specification["steps"][0]["commands"].append("echo ${undefined}")
+    with pytest.raises(ValidationError):
+        serial_load(None, specification)
@@ -13,7 +13,12 @@ import pytest
 import sys
 from pathlib import Path
 
-from reana_commons.snakemake import snakemake_load
+from reana_commons.errors import REANAValidationError
+from reana_commons.snakemake import (
+    _read_configfile,
+    snakemake_load,
+    snakemake_load_steps,
+)
 
 
 @pytest.mark.xfail(
@@ -46,3 +51,56 @@ def test_snakemake_load(tmpdir, dummy_snakefile):
         "baz": ["foo", "bar"],
         "all": ["foo", "bar", "baz"],
     }
+
+
+def test_snakemake_load_invalid(tmpdir):
+    """Test that an invalid Snakefile raises a validation error."""
+    workdir = tmpdir.mkdir("sub")
+    p = workdir.join("Snakefile")
+    p.write("rule foo:\n    output: 'foo.txt'\n    shell: 'touch {output}'\n  bad")
+
+    os.chdir(tmpdir)
+    with pytest.raises(REANAValidationError):
+        snakemake_load(Path(p.strpath), workdir=Path(workdir.strpath))
+    assert os.getcwd() == tmpdir
+
+
+@pytest.mark.xfail(
+    sys.version_info >= (3, 11),
+    reason="Test expected to fail for python versions 3.11 and above as we currently return only empty dictionary in snakemake_load_steps function for python >= 3.11.",
+)
+def test_snakemake_load_steps(tmpdir, dummy_snakefile):
+    """Test that Snakemake steps are loaded without building the DAG."""
+    workdir = tmpdir.mkdir("sub")
+    p = workdir.join("Snakefile")
+    p.write(dummy_snakefile)
+    # the input file is missing, so building the DAG would fail
+
+    os.chdir(tmpdir)
+    metadata = snakemake_load_steps(Path(p.strpath), workdir=Path(workdir.strpath))
+    assert os.getcwd() == tmpdir
+
+    assert metadata["job_dependencies"] == {}
+    assert sorted(step["name"] for step in metadata["steps"]) == ["bar", "baz", "foo"]
+    for step in metadata["steps"]:
+        assert step["kubernetes_memory_limit"] == "256Mi"
+
+
+@pytest.mark.xfail(
+    sys.version_info >= (3, 11),
+    reason="Test expected to fail for python versions 3.11 and above as config files are loaded only by the Snakemake 7 loader.",
+)
+def test_read_configfile(tmp_path):
+    """Test that Snakemake config files are reloaded only when modified."""
+    configfile = tmp_path / "config.yaml"
+    configfile.write_text("samples:\n  - a\n  - b\n")
+
+    config = _read_configfile(str(configfile))
+    assert config == {"samples": ["a", "b"]}
+    # the returned config can be modified without affecting later loads
+    config["samples"].append("c")
+    assert _read_configfile(str(configfile)) == {"samples": ["a", "b"]}
+
+    configfile.write_text("samples:\n  - d\n")
+    os.utime(configfile, ns=(0, 0))
+    assert _read_configfile(str(configfile)) == {"samples": ["d"]}
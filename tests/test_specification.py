@@ -7,11 +7,13 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 """REANA-Commons specification utils tests."""
 
+import logging
 import pathlib
 import pytest
 import sys
+import threading
 
-from reana_commons.specification import load_reana_spec
+from reana_commons.specification import cwl_load, load_reana_spec
 
 
 def test_empty_parameters(tmp_path: pathlib.Path):
@@ -54,3 +56,57 @@ def test_parameters_file(tmp_path: pathlib.Path):
 
     reana_spec = load_reana_spec(str(reana_yaml), workspace_path=str(tmp_path))
     assert reana_spec["inputs"]["parameters"]["qwerty"] == 123
+
+
+def test_cwl_load_packs_workflow(tmp_path: pathlib.Path):
+    """Test that CWL workflows are packed together with their steps."""
+    (tmp_path / "tool.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: CommandLineTool\n"
+        "baseCommand: echo\n"
+        "inputs:\n"
+        "  message:\n"
+        "    type: string\n"
+        "    inputBinding: {position: 1}\n"
+        "outputs: []\n"
+    )
+    (tmp_path / "workflow.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: Workflow\n"
+        "inputs:\n"
+        "  msg: string\n"
+        "outputs: []\n"
+        "steps:\n"
+        "  echo:\n"
+        "    run: tool.cwl\n"
+        "    in: {message: msg}\n"
+        "    out: []\n"
+    )
+
+    cwltool_logger = logging.getLogger("cwltool")
+    cwltool_logger.setLevel(logging.DEBUG)
+    packed = cwl_load("workflow.cwl", basedir=str(tmp_path))
+    # the logger level of the host application is left untouched, even when
+    # workflows are loaded concurrently
+    assert cwltool_logger.level == logging.DEBUG
+    threads = [
+        threading.Thread(
+            target=cwl_load, args=("workflow.cwl",), kwargs={"basedir": str(tmp_path)}
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cwltool_logger.level == logging.DEBUG
+    cwltool_logger.setLevel(logging.NOTSET)
+    assert packed["cwlVersion"] == "v1.0"
+    assert sorted(process["class"] for process in packed["$graph"]) == [
+        "CommandLineTool",
+        "Workflow",
+    ]
+
+    tool = cwl_load("tool.cwl", basedir=str(tmp_path))
+    assert tool["class"] == "CommandLineTool"
+    assert "$graph" not in tool
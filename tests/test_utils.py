@@ -8,23 +8,41 @@
 
 """REANA-Commons utilities testing."""
 
+import json
 import os
 import shutil
+import subprocess
+import sys
+import threading
 import time
-from hashlib import md5
+import traceback
+from hashlib import blake2b
 
 import pkg_resources
 import pytest
+import requests
+from mock import Mock, patch
 from pytest_reana.fixtures import sample_workflow_workspace
 
+from reana_commons import utils, workspace
+from reana_commons.errors import REANAMissingWorkspaceError
 from reana_commons.utils import (
+    build_progress_message,
+    build_unique_component_name,
     calculate_file_access_time,
     calculate_hash_of_dir,
     calculate_job_input_hash,
+    check_connection_to_job_controller,
     click_table_printer,
+    copy_openapi_specs,
     format_cmd,
+    get_disk_usage,
+    get_disk_usage_iter,
+    get_files_recursive_wildcard,
     get_workflow_status_change_verb,
     get_trimmed_workflow_id,
+    remove_upper_level_references,
+    run_command,
 )
 
 
@@ -65,6 +83,15 @@ def test_click_table_printer_filter_wrong_header(capsys):
     assert out == "\n\n\n"
 
 
+def test_click_table_printer_values(capsys):
+    """Test click_table_printer with mixed-case headers and non-string values."""
+    headers = ["Name", "size", "shared"]
+    sample_data = [["workflow", 1024, True], ["other", None, False]]
+    click_table_printer(headers, ["name", "SHARED"], sample_data)
+    out, err = capsys.readouterr()
+    assert out == "NAME       SHARED\nworkflow   True  \nother      False \n"
+
+
 def test_calculate_hash_of_dir(sample_workflow_workspace):  # noqa: F811
     """Test calculate_hash_of_dir."""
     non_existing_dir_hash = calculate_hash_of_dir("a/b/c")
@@ -77,20 +104,78 @@ def test_calculate_hash_of_dir(sample_workflow_workspace):  # noqa: F811
     shutil.rmtree(sample_workflow_workspace_path)
     shutil.copytree(test_workspace_path, sample_workflow_workspace_path)
     dir_hash = calculate_hash_of_dir(sample_workflow_workspace_path)
-    assert dir_hash == "cb2669b4d7651aa717b6952fce85575f"
+    assert dir_hash == "d5ef9287f9847a0db3a92dc4d0d3296a"
     include_only_path = os.path.join(
         sample_workflow_workspace_path, "code", "worldpopulation.ipynb"
     )
     hash_of_single_file = calculate_hash_of_dir(
         sample_workflow_workspace_path, [include_only_path]
     )
-    assert hash_of_single_file == "18ce945e21ab4db472525abe1e0f8080"
+    assert hash_of_single_file == "713d4430f133e745d5a8129385b5c909"
+    with open(include_only_path, "rb") as f:
+        file_hash = blake2b(f.read(), digest_size=16)
+    assert hash_of_single_file == (
+        blake2b(file_hash.digest(), digest_size=16).hexdigest()
+    )
     empty_dir_hash = calculate_hash_of_dir(sample_workflow_workspace_path, [])
-    md5_hash = md5()
-    assert empty_dir_hash == md5_hash.hexdigest()
+    assert empty_dir_hash == blake2b(digest_size=16).hexdigest()
     shutil.rmtree(sample_workflow_workspace_path)
 
 
+def test_calculate_hash_of_dir_order(tmp_path):
+    """Test that the hash of a directory does not depend on creation order."""
+    contents = {"b/x.txt": b"x", "a/y.txt": b"y", "z.txt": b"z", "a/c/w": b"w"}
+    first, second = tmp_path / "first", tmp_path / "second"
+    for directory, paths in ((first, contents), (second, reversed(contents))):
+        for path in paths:
+            (directory / path).parent.mkdir(parents=True, exist_ok=True)
+            (directory / path).write_bytes(contents[path])
+    assert calculate_hash_of_dir(str(first)) == calculate_hash_of_dir(str(second))
+
+    (second / "a" / "y.txt").write_bytes(b"changed")
+    assert calculate_hash_of_dir(str(first)) != calculate_hash_of_dir(str(second))
+
+
+def test_calculate_hash_of_dir_few_files(tmp_path):
+    """Test that calculate_hash_of_dir hashes a few files in parallel."""
+    for name in ("a", "b", "c"):
+        tmp_path.joinpath(name).write_text(name)
+    expected = calculate_hash_of_dir(str(tmp_path))
+
+    # every file waits for the others, so hashing them one by one fails
+    barrier = threading.Barrier(3, timeout=5)
+    calculate_hash_of_file = utils._calculate_hash_of_file
+
+    def calculate_hash_of_file_together(file_path):
+        barrier.wait()
+        return calculate_hash_of_file(file_path)
+
+    with patch(
+        "reana_commons.utils._calculate_hash_of_file", calculate_hash_of_file_together
+    ):
+        assert calculate_hash_of_dir(str(tmp_path)) == expected
+
+
+def test_calculate_hash_of_dir_fast(tmp_path):
+    """Test calculate_hash_of_dir based on the size and mtime of the files."""
+    tmp_path.joinpath("subdir").mkdir()
+    tmp_path.joinpath("subdir", "a.txt").write_text("a")
+    tmp_path.joinpath("b.txt").write_text("b")
+    fast_hash = calculate_hash_of_dir(str(tmp_path), fast=True)
+    assert fast_hash == calculate_hash_of_dir(str(tmp_path), fast=True)
+    assert fast_hash != calculate_hash_of_dir(str(tmp_path))
+
+    # changing the modification time changes the hash, even if the content
+    # stays the same
+    os.utime(tmp_path / "b.txt", ns=(0, 0))
+    assert fast_hash != calculate_hash_of_dir(str(tmp_path), fast=True)
+
+    only_b = [str(tmp_path / "b.txt")]
+    expected = blake2b(b"b.txt\x001\x000\n", digest_size=16).hexdigest()
+    assert calculate_hash_of_dir(str(tmp_path), only_b, fast=True) == expected
+    assert calculate_hash_of_dir("a/b/c", fast=True) == -1
+
+
 def test_calculate_job_input_hash():
     """Test calculate_job_input_hash."""
     job_spec_1 = {"workflow_workspace": "test"}
@@ -100,8 +185,19 @@ def test_calculate_job_input_hash():
         job_spec_1, workflow_json
     ) == calculate_job_input_hash(job_spec_2, workflow_json)
 
+    job_spec = {"cmd": "ls", "env_vars": {"A": "1", "B": "2"}}
+    workflow_json = {"steps": [{"name": "first"}], "inputs": {"files": []}}
+    job_hash = calculate_job_input_hash(job_spec, workflow_json)
+    assert len(job_hash) == 32
+    assert job_hash == calculate_job_input_hash(
+        {"env_vars": {"B": "2", "A": "1"}, "cmd": "ls"},
+        {"inputs": {"files": []}, "steps": [{"name": "first"}]},
+    )
+    assert job_hash != calculate_job_input_hash({"cmd": "ls -l"}, workflow_json)
 
-def test_calculate_file_access_time(tmp_path):
+
+@pytest.mark.parametrize("stat_workers", [0, 4])
+def test_calculate_file_access_time(tmp_path, stat_workers):
     """Test calculate_file_access_time."""
     before_writing_files = time.time() - 1
     tmp_path.joinpath("a.txt").write_text("content of a")
@@ -111,7 +207,8 @@ def test_calculate_file_access_time(tmp_path):
     tmp_path.joinpath("another_subdir").mkdir()
     after_writing_files = time.time() + 1
 
-    access_times = calculate_file_access_time(str(tmp_path))
+    with patch("reana_commons.utils.REANA_FILE_ACCESS_TIME_STAT_WORKERS", stat_workers):
+        access_times = calculate_file_access_time(str(tmp_path))
 
     assert len(access_times) == 2
     assert str(tmp_path / "a.txt") in access_times
@@ -120,6 +217,303 @@ def test_calculate_file_access_time(tmp_path):
         assert before_writing_files <= access_time <= after_writing_files
 
 
+def test_calculate_file_access_time_symlink_swap(tmp_path):
+    """Test that files are not checked outside the workspace after the walk."""
+    workflow_workspace = tmp_path / "workspace"
+    workflow_workspace.joinpath("subdir").mkdir(parents=True)
+    workflow_workspace.joinpath("subdir", "b.txt").write_text("content of b")
+    tmp_path.joinpath("outside").mkdir()
+    tmp_path.joinpath("outside", "b.txt").write_text("content outside")
+
+    def scandir_and_swap(path):
+        yield from scandir(path)
+        # the directory is replaced by a symlink after having been walked
+        shutil.rmtree(workflow_workspace / "subdir")
+        workflow_workspace.joinpath("subdir").symlink_to(tmp_path / "outside")
+
+    scandir = workspace.scandir
+    with patch("reana_commons.utils.REANA_FILE_ACCESS_TIME_STAT_WORKERS", 4), patch(
+        "reana_commons.utils.workspace.scandir", scandir_and_swap
+    ):
+        assert calculate_file_access_time(str(workflow_workspace)) == {}
+
+
+@pytest.mark.parametrize("use_du", [False, True])
+def test_get_disk_usage(tmp_path, monkeypatch, use_du):
+    """Test get_disk_usage."""
+    tmp_path.joinpath("subdir").mkdir()
+    tmp_path.joinpath("subdir", "a.txt").write_text("a" * 10000)
+    tmp_path.joinpath("b.txt").write_text("b")
+    os.link(tmp_path / "b.txt", tmp_path / "subdir" / "hardlink")
+    tmp_path.joinpath("symlink").symlink_to("subdir")
+
+    def disk_usage(*parts):
+        return os.lstat(tmp_path.joinpath(*parts)).st_blocks * 512
+
+    directory = str(tmp_path)
+    monkeypatch.setattr("reana_commons.utils.REANA_DISK_USAGE_USE_DU", use_du)
+    sizes = {entry["name"]: entry["size"]["raw"] for entry in get_disk_usage(directory)}
+    # files linked more than once are only counted the first time
+    assert len(sizes) == 5
+    assert ("/b.txt" in sizes) != ("/subdir/hardlink" in sizes)
+    assert sizes["/subdir/a.txt"] == disk_usage("subdir", "a.txt")
+    assert sizes["/symlink"] == disk_usage("symlink")
+    assert sizes["/subdir"] == (
+        disk_usage("subdir")
+        + disk_usage("subdir", "a.txt")
+        + sizes.get("/subdir/hardlink", 0)
+    )
+    total = (
+        disk_usage()
+        + disk_usage("subdir")
+        + disk_usage("subdir", "a.txt")
+        + disk_usage("b.txt")
+        + disk_usage("symlink")
+    )
+    assert sizes[""] == total
+
+    summary = get_disk_usage(directory, summarize=True, to_human_readable_units=str)
+    assert summary == [
+        {"name": "", "size": {"raw": total, "human_readable": str(total)}}
+    ]
+
+    search = json.dumps({"name": ["subdir/*.txt"]})
+    assert get_disk_usage(directory, search=search) == [
+        {"name": "/subdir/a.txt", "size": {"raw": disk_usage("subdir", "a.txt")}}
+    ]
+    assert get_disk_usage(directory, search=json.dumps({"name": ["none*"]})) == []
+
+    # paths matching more than one filter, or hard-linked, are only counted once
+    search = json.dumps({"name": ["**/*.txt", "subdir", "b.txt"]})
+    assert get_disk_usage(directory, search=search) == [
+        {"name": "/subdir/hardlink", "size": {"raw": disk_usage("b.txt")}},
+        {"name": "/subdir/a.txt", "size": {"raw": disk_usage("subdir", "a.txt")}},
+    ]
+
+
+def test_get_disk_usage_deep(tmp_path):
+    """Test get_disk_usage on directories nested deeper than the recursion limit."""
+    path = tmp_path
+    for _ in range(150):
+        path = path / "d"
+        path.mkdir()
+    directory = str(tmp_path)
+    recursion_limit = sys.getrecursionlimit()
+    # the tree is kept small enough to be removed by pytest, so the recursion
+    # limit is lowered instead, leaving some room above the current stack
+    sys.setrecursionlimit(len(traceback.extract_stack()) + 100)
+    try:
+        with patch("reana_commons.utils.REANA_DISK_USAGE_USE_DU", False):
+            summary = get_disk_usage(directory, summarize=True)
+            disk_usage = get_disk_usage(directory)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    with patch("reana_commons.utils.REANA_DISK_USAGE_USE_DU", True):
+        assert get_disk_usage(directory, summarize=True) == summary
+    assert len(disk_usage) == 151
+    # contents of directories come before the directories themselves
+    assert disk_usage[0]["name"] == "/d" * 150
+    assert disk_usage[-1] == summary[0]
+
+
+def test_get_disk_usage_search_walk(tmp_path):
+    """Test that get_disk_usage only walks the directories matching a search."""
+    tmp_path.joinpath("data", "nested").mkdir(parents=True)
+    tmp_path.joinpath("data", "nested", "a.csv").write_text("a")
+    tmp_path.joinpath("data", "nested", "b.txt").write_text("b")
+    tmp_path.joinpath("other").mkdir()
+    tmp_path.joinpath("other", "c.csv").write_text("c")
+
+    search = json.dumps({"name": ["data/**/*.csv", "data/*/b.*", "missing/*"]})
+    with patch("reana_commons.utils.workspace.walk", wraps=workspace.walk) as walk:
+        disk_usage = get_disk_usage(str(tmp_path), search=search)
+    assert sorted(entry["name"] for entry in disk_usage) == [
+        "/data/nested/a.csv",
+        "/data/nested/b.txt",
+    ]
+    # patterns are matched from their longest prefix without wildcards, and
+    # the ones sharing the same prefix in a single walk
+    walk.assert_called_once_with(str(tmp_path), "data")
+
+
+def test_get_disk_usage_search_symlinks(tmp_path):
+    """Test that searches do not follow symlinks, with or without wildcards."""
+    workflow_workspace = tmp_path / "workspace"
+    workflow_workspace.mkdir()
+    workflow_workspace.joinpath("link").symlink_to(tmp_path / "outside")
+    tmp_path.joinpath("outside").mkdir()
+    tmp_path.joinpath("outside", "a.txt").write_text("a")
+
+    directory = str(workflow_workspace)
+    for name in ("link/a.txt", "link/*.txt"):
+        search = json.dumps({"name": [name]})
+        assert get_disk_usage(directory, search=search) == []
+    # the symlink itself is still matched
+    search = json.dumps({"name": ["link"]})
+    assert [entry["name"] for entry in get_disk_usage(directory, search=search)] == [
+        "/link"
+    ]
+
+
+def test_get_disk_usage_du(tmp_path):
+    """Test get_disk_usage computed with the ``du`` command."""
+    tmp_path.joinpath("sub dir").mkdir()
+    tmp_path.joinpath("sub dir", "a b.txt").write_text("a" * 10000)
+    tmp_path.joinpath("c.txt").write_text("c")
+    size = os.lstat(tmp_path / "c.txt").st_blocks * 512
+    search = json.dumps({"name": ["**/*.txt"], "size": ["0", str(size)]})
+    with patch("reana_commons.utils.REANA_DISK_USAGE_USE_DU", False):
+        expected = get_disk_usage(str(tmp_path))
+        expected_search = get_disk_usage(str(tmp_path), search=search)
+    assert {entry["name"] for entry in expected_search} == {"/c.txt"}
+    with patch("reana_commons.utils.REANA_DISK_USAGE_USE_DU", True):
+        assert get_disk_usage(str(tmp_path)) == expected
+        assert get_disk_usage(str(tmp_path), search=search) == expected_search
+
+
+def test_get_disk_usage_iter(tmp_path):
+    """Test get_disk_usage_iter."""
+    tmp_path.joinpath("subdir").mkdir()
+    tmp_path.joinpath("subdir", "a.txt").write_text("a")
+    tmp_path.joinpath("b.txt").write_text("b")
+
+    disk_usage = get_disk_usage_iter(str(tmp_path), to_human_readable_units=str)
+    assert isinstance(next(disk_usage), dict)
+    assert list(get_disk_usage_iter(str(tmp_path))) == get_disk_usage(str(tmp_path))
+
+    # missing directories are reported before starting to iterate
+    with pytest.raises(REANAMissingWorkspaceError):
+        get_disk_usage_iter(str(tmp_path / "missing"))
+
+
+def test_get_disk_usage_iter_du(tmp_path):
+    """Test that get_disk_usage_iter returns the output of ``du`` while it runs."""
+    finished = tmp_path / "finished"
+    # stands in for `du`, printing one entry and then failing once told to
+    script = (
+        f"printf '4096\\t{tmp_path}/a.txt\\n'; "
+        f"for i in $(seq 1000); do [ -e '{finished}' ] && break; sleep 0.01; done; "
+        "exit 1"
+    )
+    popen = subprocess.Popen
+
+    def fake_du(args, **kwargs):
+        return popen(["sh", "-c", script], **kwargs)
+
+    with patch("reana_commons.utils.REANA_DISK_USAGE_USE_DU", True), patch(
+        "reana_commons.utils.subprocess.Popen", fake_du
+    ):
+        disk_usage = get_disk_usage_iter(str(tmp_path))
+        assert next(disk_usage) == {"name": "/a.txt", "size": {"raw": 4096}}
+        assert not finished.exists()
+        finished.touch()
+        with pytest.raises(subprocess.CalledProcessError):
+            next(disk_usage)
+
+
+def test_get_files_recursive_wildcard(tmp_path):
+    """Test get_files_recursive_wildcard."""
+    tmp_path.joinpath("data", "nested").mkdir(parents=True)
+    tmp_path.joinpath("data", "a.csv").write_text("a")
+    tmp_path.joinpath("data", "nested", "b.csv").write_text("b")
+
+    paths, prefix = get_files_recursive_wildcard(str(tmp_path), "../data")
+    assert prefix == tmp_path
+    assert sorted(paths) == [tmp_path / "data" / "a.csv", tmp_path / "data" / "nested"]
+
+    paths, _ = get_files_recursive_wildcard(str(tmp_path), "data/**/*.csv")
+    # longest paths come first
+    assert paths == [
+        tmp_path / "data" / "nested" / "b.csv",
+        tmp_path / "data" / "a.csv",
+    ]
+
+
+def test_build_progress_message():
+    """Test build_progress_message."""
+    assert build_progress_message() == {}
+    total = {"total": 3, "job_ids": []}
+    finished = {"total": 1, "job_ids": ["1"]}
+    assert build_progress_message(total=total, running=None, finished=finished) == {
+        "total": total,
+        "finished": finished,
+    }
+
+
+def test_build_unique_component_name():
+    """Test build_unique_component_name."""
+    assert build_unique_component_name("run-job", "123") == "reana-run-job-123"
+    assert build_unique_component_name("run-batch").startswith("reana-run-batch-")
+    with pytest.raises(ValueError, match="not valid component type"):
+        build_unique_component_name("run-coffee", "123")
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("a/b.txt", "a/b.txt"),
+        ("/a", "a"),
+        ("//a", "a"),
+        ("dir/", "dir"),
+        ("a/./b//c", "a/b/c"),
+        ("../../etc/passwd", "etc/passwd"),
+        ("a/../../b", "b"),
+        ("", ""),
+    ],
+)
+def test_remove_upper_level_references(path, expected):
+    """Test remove_upper_level_references."""
+    assert remove_upper_level_references(path) == expected
+
+
+def test_copy_openapi_specs(tmp_path, monkeypatch):
+    """Test copy_openapi_specs."""
+    specs_path = tmp_path / "reana-commons" / "reana_commons" / "openapi_specifications"
+    specs_path.mkdir(parents=True)
+    component_path = tmp_path / "reana-server"
+    component_path.joinpath("docs").mkdir(parents=True)
+    output_path = component_path / "openapi.json"
+    output_path.write_text("{}")
+    monkeypatch.setenv("REANA_SRCDIR", str(tmp_path))
+    monkeypatch.chdir(component_path)
+
+    copy_openapi_specs(str(output_path), "reana-server")
+    assert specs_path.joinpath("reana_server.json").read_text() == "{}"
+    assert component_path.joinpath("docs", "openapi.json").read_text() == "{}"
+
+    with pytest.raises(ValueError, match="has no OpenAPI specifications"):
+        copy_openapi_specs(str(output_path), "reana-ui")
+
+
+def test_run_command(tmp_path):
+    """Test run_command with shell command strings and argument lists."""
+    assert run_command("echo a b | tr ab xy", display=False, return_output=True) == (
+        "x y"
+    )
+    file_path = tmp_path / "file with spaces.txt"
+    file_path.write_text("content")
+    assert (
+        run_command(["cat", str(file_path)], display=False, return_output=True)
+        == "content"
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        run_command(["false"], display=False)
+    assert exc_info.value.code == 1
+
+
+def test_run_command_not_found(capfd):
+    """Test run_command with programs that cannot be found."""
+    for cmd in ("no-such-binary", ["no-such-binary"]):
+        with pytest.raises(SystemExit) as exc_info:
+            run_command(cmd, display=False)
+        assert exc_info.value.code == 127
+        assert capfd.readouterr().err.endswith("no-such-binary: not found\n")
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_command(cmd, display=False, return_output=True, stderr_output=True)
+        assert exc_info.value.code.endswith("no-such-binary: not found\n")
+
+
 def test_format_cmd():
     """Test format_cmd."""
     test_cmd = "ls -l"
@@ -170,3 +564,46 @@ def test_get_workflow_status_change_verb_invalid():
 def test_get_trimmed_workflow_id(workflow_id, trim_level, expected):
     """Test get_trimmed_workflow_id function with several different inputs."""
     assert get_trimmed_workflow_id(workflow_id, trim_level) == expected
+
+
+def test_check_connection_to_job_controller():
+    """Test check_connection_to_job_controller retries with backoff."""
+    clock = Mock(now=0)
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    def slow_get(url, timeout):
+        sleep(timeout)
+        raise requests.Timeout()
+
+    responses = [ConnectionError(), Mock(status_code=503), Mock(status_code=200)]
+    with patch("requests.Session.get", side_effect=responses) as get, patch(
+        "reana_commons.utils.time.monotonic", lambda: clock.now
+    ), patch("reana_commons.utils.time.sleep", side_effect=sleep) as sleep_mock:
+        check_connection_to_job_controller()
+    assert get.call_count == 3
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [1, 2]
+
+    clock.now = 0
+    with patch("requests.Session.get", side_effect=ConnectionError()), patch(
+        "reana_commons.utils.time.monotonic", lambda: clock.now
+    ), patch("reana_commons.utils.time.sleep", side_effect=sleep) as sleep_mock, patch(
+        "reana_commons.utils.logging.error"
+    ) as log_error:
+        check_connection_to_job_controller()
+    sleeps = [call.args[0] for call in sleep_mock.call_args_list]
+    assert sleeps == [1, 2, 4, 8, 10, 10, 10, 5]
+    log_error.assert_called_once()
+
+    # the time spent waiting for responses counts towards the total time
+    clock.now = 0
+    with patch("requests.Session.get", side_effect=slow_get) as get, patch(
+        "reana_commons.utils.time.monotonic", lambda: clock.now
+    ), patch("reana_commons.utils.time.sleep", side_effect=sleep), patch(
+        "reana_commons.utils.logging.error"
+    ):
+        check_connection_to_job_controller()
+    timeouts = [call.kwargs["timeout"] for call in get.call_args_list]
+    assert timeouts == [10, 10, 10, 10, 1]
+    assert clock.now == 51
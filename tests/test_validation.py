@@ -7,11 +7,15 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """REANA-Commons validation testing."""
+
 import operator
 
 import pytest
 from jsonschema.exceptions import ValidationError
 
+from reana_commons.errors import REANAValidationError
+from reana_commons.validation.compute_backends import build_compute_backends_validator
+from reana_commons.validation.parameters import build_parameters_validator
 from reana_commons.validation.utils import validate_reana_yaml
 
 
@@ -85,3 +89,146 @@ def test_critical_errors_reana_yaml(yadage_workflow_spec_loaded):
     del reana_yaml["workflow"]
     with pytest.raises(ValidationError):
         validate_reana_yaml(reana_yaml)
+
+
+@pytest.mark.parametrize(
+    "workflow",
+    [
+        {
+            "type": "serial",
+            "specification": {"steps": [{"compute_backend": "slurmcern"}]},
+        },
+        {
+            "type": "yadage",
+            "specification": {
+                "stages": [
+                    {
+                        "name": "fit",
+                        "scheduler": {
+                            "step": {
+                                "environment": {
+                                    "resources": [{"compute_backend": "slurmcern"}]
+                                }
+                            }
+                        },
+                    }
+                ]
+            },
+        },
+        {
+            "type": "cwl",
+            "specification": {
+                "$graph": [
+                    {
+                        "steps": [
+                            {
+                                "id": "fit",
+                                "hints": [
+                                    {"class": "reana", "compute_backend": "slurmcern"}
+                                ],
+                            }
+                        ]
+                    }
+                ]
+            },
+        },
+        {
+            "type": "snakemake",
+            "specification": {"steps": [{"compute_backend": "slurmcern"}]},
+        },
+    ],
+)
+def test_build_compute_backends_validator(workflow):
+    """Test building the compute backends validator of each workflow type."""
+    reana_yaml = {"workflow": workflow}
+    build_compute_backends_validator(reana_yaml, ["kubernetes", "slurmcern"]).validate()
+    validator = build_compute_backends_validator(reana_yaml, ["kubernetes"])
+    with pytest.raises(REANAValidationError, match='"slurmcern"'):
+        validator.validate()
+
+
+def test_build_compute_backends_validator_unknown_type():
+    """Test that no validator is built for unknown workflow types."""
+    reana_yaml = {"workflow": {"type": "unknown", "specification": {}}}
+    assert build_compute_backends_validator(reana_yaml, ["kubernetes"]) is None
+
+
+def test_compute_backends_validator_yadage_nested_stages():
+    """Test that nested Yadage stages are validated in order."""
+
+    def stage(name, backend):
+        resources = [{"compute_backend": backend}]
+        return {
+            "name": name,
+            "scheduler": {"step": {"environment": {"resources": resources}}},
+        }
+
+    stages = [
+        stage("first", "kubernetes"),
+        {
+            "name": "nested",
+            "scheduler": {
+                "workflow": {
+                    "stages": [
+                        stage("second", "kubernetes"),
+                        {"name": "empty", "scheduler": {"workflow": {}}},
+                        stage("third", "htcondorcern"),
+                    ]
+                }
+            },
+        },
+        stage("fourth", "slurmcern"),
+    ]
+    reana_yaml = {"workflow": {"type": "yadage", "specification": {"stages": stages}}}
+    validator = build_compute_backends_validator(reana_yaml, ["kubernetes"])
+    with pytest.raises(REANAValidationError, match='in step "third"'):
+        validator.validate()
+    validator = build_compute_backends_validator(
+        reana_yaml, ["kubernetes", "htcondorcern"]
+    )
+    with pytest.raises(REANAValidationError, match='in step "fourth"'):
+        validator.validate()
+
+
+@pytest.mark.parametrize(
+    "workflow_type,commands,expected_params",
+    [
+        ("serial", ["echo ${a} ${b}", "cat ${a}\n${c}", "ls"], {"a", "b", "c"}),
+        (
+            "snakemake",
+            ["cat {input.a} > {output.b}", "run {params.c} {wildcards.d}"],
+            {"a", "b", "c"},
+        ),
+    ],
+)
+def test_parameters_validator_command_params(workflow_type, commands, expected_params):
+    """Test parsing the parameters used in the commands of each step."""
+    reana_yaml = {
+        "workflow": {
+            "type": workflow_type,
+            "specification": {"steps": [{"commands": commands}]},
+        }
+    }
+    validator = build_parameters_validator(reana_yaml)
+    assert validator.steps[0]["command_params"] == expected_params
+
+
+def test_parameters_validator_dangerous_operations():
+    """Test the warnings about dangerous operations in step commands."""
+    reana_yaml = {
+        "inputs": {"parameters": {}},
+        "workflow": {
+            "type": "serial",
+            "specification": {
+                "steps": [
+                    {"name": "fit", "commands": ["sudo rm -rf x", "cd /tmp && ls"]}
+                ]
+            },
+        },
+    }
+    validator = build_parameters_validator(reana_yaml)
+    validator.validate_parameters()
+    assert [warning["message"] for warning in validator.operations_warnings] == [
+        'Operation "sudo" found in step "fit" might be dangerous.',
+        'Operation "cd /" found in step "fit" might be dangerous.',
+    ]
@@ -316,3 +316,18 @@ def test_iterdir(path, expected, test_workspace):
     result = list(workspace.iterdir(test_workspace, path))
     assert len(result) == len(expected)
     assert set(result) == set(expected)
+
+
+def test_scandir(test_workspace):
+    """Test that scandir returns all the entries without following symlinks."""
+    entries = dict(workspace.scandir(test_workspace))
+    assert set(entries) == set(workspace.walk(test_workspace))
+    assert entries["symdir"].is_symlink()
+    assert not entries["symdir"].is_dir(follow_symlinks=False)
+    assert entries["dir/subdir"].is_dir(follow_symlinks=False)
+
+    for path, entry in workspace.scandir(test_workspace, "dir"):
+        assert path.startswith("dir/")
+        assert entry.stat(follow_symlinks=False) == workspace.lstat(
+            test_workspace, path
+        )